@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+"""Times print_matrix_integer on big matrices, written to /dev/null"""
+import os
+import random
+import sys
+from timeit import timeit
+print_matrix_integer = \
+    __import__('6-print_matrix_integer').print_matrix_integer
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [500, 1000, 2000]
+    random.seed(0)
+    with open(os.devnull, 'w') as devnull:
+        for n in sizes:
+            m = [[random.randint(-1000, 1000) for j in range(n)]
+                 for i in range(n)]
+            t_list = timeit(lambda: print_matrix_integer(m, devnull),
+                            number=1)
+            rows = ([i * n + j for j in range(n)] for i in range(n))
+            t_stream = timeit(lambda: print_matrix_integer(rows, devnull),
+                              number=1)
+            print("{0}x{0}: list {1:.3f}s, generator {2:.3f}s".format(
+                n, t_list, t_stream))
@@ -1,10 +1,30 @@
 #!/usr/bin/python3
-def print_matrix_integer(matrix=[[]]):
-    for ls in matrix:
-        i = 0
-        for elem in ls:
-            if i != 0:
-                print(" ", end='')
-            print("{:d}".format(elem), end="")
-            i += 1
-        print()
+import sys
+
+# rows formatted before each write to the file
+ROWS_PER_WRITE = 64
+INT_ONLY = {int}
+
+
+def print_matrix_integer(matrix=[[]], file=None):
+    if file is None:
+        file = sys.stdout
+    to_str = "{:d}".format
+    lines = []
+    try:
+        for ls in matrix:
+            if type(ls) is not list and type(ls) is not tuple:
+                ls = list(ls)
+            # str() gives the same digits as "{:d}" for plain ints
+            if set(map(type, ls)) <= INT_ONLY:
+                lines.append(" ".join(map(str, ls)))
+            else:
+                lines.append(" ".join(map(to_str, ls)))
+            if len(lines) == ROWS_PER_WRITE:
+                lines.append("")
+                file.write("\n".join(lines))
+                lines = []
+    finally:
+        if lines:
+            lines.append("")
+            file.write("\n".join(lines))
@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+"""Times square_matrix_simple: list comprehension, numpy and in-place"""
+import random
+import sys
+from timeit import timeit
+square_matrix_simple = \
+    __import__('0-square_matrix_simple').square_matrix_simple
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 500, 1000]
+    random.seed(0)
+    for n in sizes:
+        m = [[random.randint(-1000, 1000) for j in range(n)]
+             for i in range(n)]
+        t_list = timeit(lambda: square_matrix_simple(m), number=1)
+        t_numpy = timeit(lambda: square_matrix_simple(m, use_numpy=True),
+                         number=1)
+        copy = [row[:] for row in m]
+        t_in_place = timeit(lambda: square_matrix_simple(copy, True),
+                            number=1)
+        print("{0}x{0}: list {1:.3f}s, numpy {2:.3f}s, in place "
+              "{3:.3f}s".format(n, t_list, t_numpy, t_in_place))
@@ -1,5 +1,41 @@
 #!/usr/bin/python3
-def square_matrix_simple(matrix=[]):
-    sqared_matrix = [[row[i]**2 for i in range(len(row))] for row in matrix]
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _numpy_ok(matrix):
+    # numpy gives the same squares only for rectangular matrices of plain
+    # ints that cannot overflow int64; float x ** 2 goes through the C
+    # pow() of Python, which numpy does not reproduce bit for bit
+    if not matrix or not all(type(row) is list for row in matrix):
+        return False
+    width = len(matrix[0])
+    if width == 0 or any(len(row) != width for row in matrix):
+        return False
+    for row in matrix:
+        if not all(type(x) is int for x in row):
+            return False
+    return max(max(map(abs, row)) for row in matrix) < 2 ** 31
+
+
+def square_matrix_simple(matrix=[], in_place=False, use_numpy=False):
+    # in_place: overwrite the rows of matrix instead of building new ones
+    # use_numpy: square with numpy when it is installed; off by default
+    # because converting lists to and from an array costs more than
+    # squaring ints in Python (see 0-benchmark.py)
+    if use_numpy and np is not None and _numpy_ok(matrix):
+        squared = np.square(np.array(matrix, dtype=np.int64)).tolist()
+        if not in_place:
+            return squared
+        for row, new in zip(matrix, squared):
+            row[:] = new
+        return matrix
+    if in_place:
+        for row in matrix:
+            row[:] = [x ** 2 for x in row]
+        return matrix
+    sqared_matrix = [[x ** 2 for x in row] for row in matrix]
 
     return sqared_matrix
@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+"""Times matrix_mul on square matrices
+
+usage: ./100-benchmark.py [N ...]   (default sizes: 200 400)
+"""
+import random
+import sys
+from timeit import timeit
+matrix_mul = __import__('100-matrix_mul').matrix_mul
+
+
+def naive_mul(m_a, m_b):
+    """the previous triple loop, kept here as the reference"""
+    bcols = len(m_b[0])
+    product = [[0 for x in range(bcols)] for y in range(len(m_a))]
+    for row_i in range(len(m_a)):
+        for col_b in range(bcols):
+            sum_t = 0
+            for col_i in range(len(m_a[row_i])):
+                sum_t += m_a[row_i][col_i] * m_b[col_i][col_b]
+            product[row_i][col_b] = sum_t
+    return product
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [200, 400]
+    random.seed(0)
+    for n in sizes:
+        m_a = [[random.random() for j in range(n)] for i in range(n)]
+        m_b = [[random.random() for j in range(n)] for i in range(n)]
+        t_new = timeit(lambda: matrix_mul(m_a, m_b), number=1)
+        t_old = timeit(lambda: naive_mul(m_a, m_b), number=1)
+        print("{0}x{0}: triple loop {1:.2f}s, matrix_mul {2:.2f}s "
+              "({3:.1f}x)".format(n, t_old, t_new, t_old / t_new))
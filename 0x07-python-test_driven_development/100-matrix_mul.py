@@ -1,64 +1,74 @@
 #!/usr/bin/python3
+"""This module holds the function matrix_mul which multiplies two matrices
+"""
+from operator import mul
+check_mul_operands = __import__('matrix_validation').check_mul_operands
+SparseMatrix = __import__('sparse_matrix').SparseMatrix
+
+TILE = 64
+TILE_MIN_WORK = 64 ** 3
+# int matrices m_a with fewer nonzeros than this go to the sparse kernel
+SPARSE_DENSITY = 0.25
+
+
+def sparse_mul(m_a, m_b):
+    """Multiplies two matrices when at least one of them is a SparseMatrix
+
+    A list operand is checked by check_mul_operands, so it raises the
+    errors of matrix_mul. The SparseMatrix operand is stood in for by a
+    matrix of the same number of columns (m_a) or rows (m_b), which is
+    all those checks look at.
+
+    Return:
+        a new SparseMatrix
+    """
+    if type(m_a) is not SparseMatrix or type(m_b) is not SparseMatrix:
+        stand_in_a = m_a
+        if type(m_a) is SparseMatrix:
+            stand_in_a = [[0] * m_a.shape[1]]
+        stand_in_b = m_b
+        if type(m_b) is SparseMatrix:
+            stand_in_b = [[0]] * m_b.shape[0]
+        check_mul_operands(stand_in_a, stand_in_b)
+    if type(m_a) is not SparseMatrix:
+        m_a = SparseMatrix.from_rows(m_a)
+    if type(m_b) is not SparseMatrix:
+        m_b = SparseMatrix.from_rows(m_b)
+    return m_a.multiply(m_b)
 
 
 def matrix_mul(m_a, m_b):
     """Multiplies two matricies
-    """
 
-    # check if the two matrix's aren't empty
-    if type(m_a) != list:
-        raise TypeError("m_a must be a list")
-    if type(m_b) != list:
-        raise TypeError("m_b must be a list")
-    if len(m_a) == 0:
-        raise ValueError("m_a can't be empty")
-    # check the validity of the content of each elemtent
-    # for matrix a
-    if not all(type(row) == list for row in m_a):
-        raise TypeError("m_a must be a list of lists")
-    if len(m_a[0]) == 0:
-        raise ValueError("m_a can't be empty")
+    m_b is transposed once so each element of the product is a single
+    row-by-column dot product, and large products are computed one
+    block of TILE columns at a time.
+
+    Int matrices where m_a is mostly zeros are multiplied in sparse
+    form instead, which gives the same ints. A SparseMatrix operand
+    gives a SparseMatrix product.
+    """
 
-    # check the validity of the content of each elemtent
-    # for matrix b
-    if not all(type(row) == list for row in m_b):
-        raise TypeError("m_b must be a list of lists")
-    if len(m_b) == 0:
-        raise ValueError("m_b can't be empty")
-    if len(m_b[0]) == 0:
-        raise ValueError("m_b can't be empty")
+    if type(m_a) is SparseMatrix or type(m_b) is SparseMatrix:
+        return sparse_mul(m_a, m_b)
 
-    # Check the validity of the content of each list
-    # inside each list of matrix a
-    row_len = len(m_a[0])
-    if not all(len(row) == row_len for row in m_a):
-        raise TypeError("each row of m_a must be of the same size")
+    arows, acols, bcols, ints_only = check_mul_operands(m_a, m_b)
 
-    if not all(type(num) in [int, float] for row in m_a for num in row):
-        raise TypeError("m_a should contain only integers or floats")
-    # Check the validity of the content of each list
-    # inside each list of matrix a
-    row_len = len(m_b[0])
-    if not all(len(row) == row_len for row in m_b):
-        raise TypeError("each row of m_b must be of the same size")
+    if ints_only:
+        zeros = sum(row.count(0) for row in m_a)
+        if arows * acols - zeros < SPARSE_DENSITY * arows * acols:
+            return SparseMatrix.from_rows(m_a, True).multiply(
+                SparseMatrix.from_rows(m_b, True), dense=True)
 
-    if not all(type(num) in [int, float] for row in m_b for num in row):
-        raise TypeError("m_b should contain only integers or floats")
-    # check if the two vectors are multipliable
-    acols = len(m_a[0])
-    arows = len(m_a)
-    brows = len(m_b)
-    bcols = len(m_b[0])
-    if acols != brows:
-        raise ValueError("m_a and m_b can't be multiplied")
+    cols = list(zip(*m_b))
+    if arows * acols * bcols <= TILE_MIN_WORK:
+        return [[sum(map(mul, row, col)) for col in cols] for row in m_a]
 
-    product = [[0 for x in range(bcols)] for y in range(arows)]
-    for row_i in range(len(m_a)):
-        col_b = 0
-        while (col_b < bcols):
-            sum_t = 0
-            for col_i in range(len(m_a[row_i])):
-                sum_t += m_a[row_i][col_i] * m_b[col_i][col_b]
-            product[row_i][col_b] = sum_t
-            col_b += 1
+    # large inputs: sweep every row of m_a over a block of columns of m_b
+    # so that block stays hot while it is reused
+    product = [[] for row in m_a]
+    for col_0 in range(0, bcols, TILE):
+        block = cols[col_0:col_0 + TILE]
+        for row, out in zip(m_a, product):
+            out.extend([sum(map(mul, row, col)) for col in block])
     return product
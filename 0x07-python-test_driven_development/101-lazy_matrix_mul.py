@@ -2,14 +2,27 @@
 """
 This program takes two matrices and multiply them with the library numpy
 """
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 
-def lazy_matrix_mul(m_a, m_b):
+def lazy_matrix_mul(m_a, m_b, workers=None):
     """
     Takes two matrices and multiply them with numpy
       Args:
         m_a: list of lists (int or float)
         m_b: list of lists (int or float)
+        workers: when above 1, the rows of m_a are split into that many
+            blocks multiplied in parallel threads (numpy releases the
+            GIL during matmul), and m_b is shared by all of them
     """
-    return np.matmul(m_a, m_b)
+    if not workers or workers <= 1:
+        return np.matmul(m_a, m_b)
+    a = np.asarray(m_a)
+    b = np.asarray(m_b)
+    if a.ndim != 2 or len(a) < 2:
+        return np.matmul(a, b)
+    blocks = np.array_split(a, min(workers, len(a)))
+    with ThreadPoolExecutor(len(blocks)) as executor:
+        return np.vstack(list(executor.map(lambda blk: np.matmul(blk, b),
+                                           blocks)))
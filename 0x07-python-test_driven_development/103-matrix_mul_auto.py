@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+"""This module holds matrix_mul_auto which multiplies two matrices with
+either matrix_mul (pure Python) or numpy, whichever is faster for them
+"""
+import json
+import os
+from timeit import timeit
+check_mul_operands = __import__('matrix_validation').check_mul_operands
+matrix_mul = __import__('100-matrix_mul').matrix_mul
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CALIBRATION_FILE = os.environ.get(
+    'MATRIX_MUL_CALIBRATION',
+    os.path.join(os.path.expanduser('~'), '.cache',
+                 'matrix_mul_calibration.json'))
+INT64_MAX = 2 ** 63 - 1
+_calibration = None
+
+
+def calibrate(save=True):
+    """Times both backends on small int matrices and returns the smallest
+    amount of work (rows * inner size * cols) where numpy wins
+
+    Args:
+        save: write the result to CALIBRATION_FILE for later runs
+    Return:
+        the calibration dict
+    """
+    global _calibration
+    crossover = None
+    if np is not None:
+        for n in (4, 8, 16, 24, 32, 48, 64, 96, 128):
+            m = [[(i * n + j) % 7 for j in range(n)] for i in range(n)]
+            t_py = timeit(lambda: matrix_mul(m, m), number=3)
+            t_np = timeit(lambda: _numpy_mul(m, m), number=3)
+            if t_np < t_py:
+                crossover = n ** 3
+                break
+    _calibration = {'numpy': None if np is None else np.__version__,
+                    'numpy_min_work': crossover}
+    if save:
+        os.makedirs(os.path.dirname(CALIBRATION_FILE) or '.', exist_ok=True)
+        with open(CALIBRATION_FILE, 'w', encoding='utf-8') as f:
+            json.dump(_calibration, f)
+    return _calibration
+
+
+def load_calibration():
+    """Returns the saved calibration, running a new one when there is none
+    or when it was made with another numpy version
+    """
+    global _calibration
+    if _calibration is None:
+        try:
+            with open(CALIBRATION_FILE, encoding='utf-8') as f:
+                _calibration = json.load(f)
+        except (OSError, ValueError):
+            _calibration = None
+        current = None if np is None else np.__version__
+        if _calibration is None or _calibration.get('numpy') != current:
+            calibrate()
+    return _calibration
+
+
+def _numpy_mul(m_a, m_b):
+    """Multiplies two int matrices exactly with numpy int64"""
+    a = np.array(m_a, dtype=np.int64)
+    b = np.array(m_b, dtype=np.int64)
+    return np.matmul(a, b).tolist()
+
+
+def _fits_int64(m_a, m_b):
+    """Checks that the ints of m_a and m_b are small enough for every dot
+    product (and partial sum) to stay inside int64
+    """
+    max_a = max(max(map(abs, row)) for row in m_a)
+    max_b = max(max(map(abs, row)) for row in m_b)
+    return max_a * max_b * len(m_b) <= INT64_MAX
+
+
+def choose_backend(m_a, m_b):
+    """Returns 'numpy' or 'python' for valid operands m_a and m_b
+
+    numpy is only picked for int matrices that cannot overflow int64:
+    its float sums are not done in the same order as matrix_mul, so the
+    results would not be bit-for-bit the same.
+    """
+    arows, acols, bcols, ints_only = check_mul_operands(m_a, m_b)
+    if np is None or not ints_only:
+        return 'python'
+    min_work = load_calibration().get('numpy_min_work')
+    if min_work is None or arows * acols * bcols < min_work:
+        return 'python'
+    if not _fits_int64(m_a, m_b):
+        return 'python'
+    return 'numpy'
+
+
+def matrix_mul_auto(m_a, m_b):
+    """Multiplies two matrices like matrix_mul, using numpy when it is
+    available and faster for these operands
+
+    Args:
+        m_a: list of lists (int or float)
+        m_b: list of lists (int or float)
+    Return:
+        a new list of lists, equal to matrix_mul(m_a, m_b)
+    """
+    if choose_backend(m_a, m_b) == 'numpy':
+        return _numpy_mul(m_a, m_b)
+    return matrix_mul(m_a, m_b)
@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+"""Times parallel_matrix_mul with 1, 2, 4 and 8 worker processes
+
+usage: ./104-benchmark.py [N]   (default size: 400)
+"""
+import random
+import sys
+from timeit import timeit
+parallel_matrix_mul = \
+    __import__('104-parallel_matrix_mul').parallel_matrix_mul
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    random.seed(0)
+    m_a = [[random.random() for j in range(n)] for i in range(n)]
+    m_b = [[random.random() for j in range(n)] for i in range(n)]
+    base = None
+    for workers in (1, 2, 4, 8):
+        t = timeit(lambda: parallel_matrix_mul(m_a, m_b, workers), number=1)
+        base = base or t
+        print("{0}x{0}, {1} workers: {2:.2f}s ({3:.1f}x)".format(
+            n, workers, t, base / t))
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""This module holds parallel_matrix_mul which multiplies two matrices
+by handing out blocks of rows of m_a to a pool of processes
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from operator import mul
+import os
+check_mul_operands = __import__('matrix_validation').check_mul_operands
+matrix_mul = __import__('100-matrix_mul').matrix_mul
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+# state of a worker process, set once by _init_worker
+_cols = None
+
+
+def _typecode(m):
+    """Returns the array typecode that stores every element of m exactly
+    and gives back the same Python types, or None if there is none
+    """
+    types = {type(num) for row in m for num in row}
+    if types == {float}:
+        return 'd'
+    if types == {int} and \
+            INT64_MIN <= min(map(min, m)) and max(map(max, m)) <= INT64_MAX:
+        return 'q'
+    return None
+
+
+def _init_worker(name, typecode, ncols, m_b):
+    """Loads the columns of m_b in a worker, from shared memory when a
+    block name is given, otherwise from the pickled m_b
+    """
+    global _cols
+    if name is None:
+        _cols = list(zip(*m_b))
+        return
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        flat = shm.buf.cast(typecode)
+        _cols = [flat[j::ncols].tolist() for j in range(ncols)]
+        flat.release()
+    finally:
+        shm.close()
+
+
+def _mul_rows(rows):
+    """Multiplies a block of rows of m_a by the worker's m_b"""
+    return [[sum(map(mul, row, col)) for col in _cols] for row in rows]
+
+
+def parallel_matrix_mul(m_a, m_b, workers=None, chunk_rows=None):
+    """Multiplies two matrices like matrix_mul, using a process pool
+
+    m_b is copied once into a shared memory block that every worker
+    reads when it starts, instead of being pickled to each of them.
+    Matrices that do not fit an int64 or float64 array without changing
+    their values or types (mixed int/float, huge ints) are sent to the
+    workers once, pickled.
+
+    Args:
+        m_a: list of lists (int or float)
+        m_b: list of lists (int or float)
+        workers: number of processes, os.cpu_count() by default
+        chunk_rows: rows of m_a per task, about 4 tasks per worker
+            by default
+    Return:
+        a new list of lists, equal to matrix_mul(m_a, m_b)
+    """
+    check_mul_operands(m_a, m_b)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(m_a) == 1:
+        return matrix_mul(m_a, m_b)
+    chunk_rows = chunk_rows or max(1, -(-len(m_a) // (workers * 4)))
+    chunks = [m_a[i:i + chunk_rows] for i in range(0, len(m_a), chunk_rows)]
+    ncols = len(m_b[0])
+    typecode = _typecode(m_b)
+    shm = None
+    try:
+        if typecode is None:
+            initargs = (None, None, ncols, m_b)
+        else:
+            data = array(typecode, (num for row in m_b for num in row))
+            shm = shared_memory.SharedMemory(create=True,
+                                             size=len(data) * data.itemsize)
+            shm.buf[:len(data) * data.itemsize] = data.tobytes()
+            initargs = (shm.name, typecode, ncols, None)
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=initargs) as executor:
+            product = []
+            for rows in executor.map(_mul_rows, chunks):
+                product.extend(rows)
+        return product
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+"""Times matrix_divided: list comprehension, numpy and in-place modes
+
+usage: ./2-benchmark.py [N ...]   (default sizes: 100 500 1000)
+"""
+import random
+import sys
+from timeit import timeit
+matrix_divided = __import__('2-matrix_divided').matrix_divided
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 500, 1000]
+    random.seed(0)
+    for n in sizes:
+        m = [[random.uniform(-1e3, 1e3) for j in range(n)] for i in range(n)]
+        t_list = timeit(lambda: matrix_divided(m, 3, use_numpy=False),
+                        number=1)
+        t_numpy = timeit(lambda: matrix_divided(m, 3), number=1)
+        copy = [row[:] for row in m]
+        t_in_place = timeit(lambda: matrix_divided(copy, 3, in_place=True),
+                            number=1)
+        print("{0}x{0}: list {1:.3f}s, default {2:.3f}s, in place "
+              "{3:.3f}s".format(n, t_list, t_numpy, t_in_place))
@@ -1,35 +1,76 @@
 #!/usr/bin/python3
 """This module holds the function matrix_divided which takes in a matrix and divides each element by div
 """
+check_divided_operands = \
+    __import__('matrix_validation').check_divided_operands
+check_div = __import__('matrix_validation').check_div
+SparseMatrix = __import__('sparse_matrix').SparseMatrix
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def matrix_divided(matrix, div):
+# below this many elements the list comprehension is faster than numpy
+NUMPY_MIN_SIZE = 4096
+# ints up to this size are exact in a float64, so dividing them in numpy
+# gives the same quotient as Python's true division
+EXACT_INT = 2 ** 53
+
+
+def _numpy_divided(matrix, div):
+    """Returns the rows of matrix divided by div and rounded to 2 decimals
+
+    numpy rounds with rint(q * 100) / 100, which only differs from
+    round(q, 2) when q * 100 lies within rounding error of a half or is
+    too big to have decimals. Those elements are rounded again with
+    round() so the result is exactly the one of the pure Python path.
+    """
+    q = np.array(matrix, dtype=np.float64) / div
+    y = q * 100
+    rounded = np.rint(y) / 100
+    size = np.abs(y)
+    near = ~(size < 2.0 ** 52) | \
+        (np.abs(np.abs(y - np.floor(y)) - 0.5) <= size * 2.0 ** -50)
+    for i, j in zip(*np.nonzero(near)):
+        rounded[i, j] = round(float(q[i, j]), 2)
+    return rounded.tolist()
+
+
+def matrix_divided(matrix, div, in_place=False, use_numpy=None):
     """Returns a new list of lists that has been divided by div
     Args:
-        matrix: a list of lists
+        matrix: a list of lists, or a SparseMatrix which gives a
+            SparseMatrix back
         div: the number to divide by
+        in_place: write the results into the rows of matrix and
+            return matrix, instead of building a new one
+        use_numpy: None uses numpy for big matrices when it is
+            installed, False never uses it
     Return:
         a new matrix
     """
 
-    row_check = 0
-    if not any(matrix):
-        raise TypeError("matrix must be a matrix (list of lists) of\
-                integer/floats")
-    if matrix[0] is not None:
-        row_check = len(matrix[0])
-    if div == 0:
-        raise ZeroDivisionError("division by zero")
-    if type(div) is not int and type(div) is not float:
-        raise TypeError("div must be a number")
-    for row in matrix:
-        if type(row) is not list:
-            raise TypeError("matrix must be a matrix (list of lists) of \
-                    integer/floats")
-            for num in row:
-                if type(num) is not int and type(num) is not float:
-                    raise TypeError("matrix must be a matrix (list of lists) of\
-                            integers/floats")
-            if len(row) != row_check:
-                raise TypeError("Each row of the matrix must have the same size")
-
-        return [[round(num / div, 2) for num in row] for row in matrix]
+    if type(matrix) is SparseMatrix:
+        check_div(div)
+        divided = matrix.divided(div)
+        if not in_place:
+            return divided
+        matrix.data[:] = divided.data
+        matrix.fill = divided.fill
+        return matrix
+    info = check_divided_operands(matrix, div)
+    if use_numpy is not False and np is not None and \
+            info.rows * info.cols >= NUMPY_MIN_SIZE and \
+            abs(div) < EXACT_INT and \
+            max(max(map(abs, row)) for row in matrix) < EXACT_INT:
+        divided = _numpy_divided(matrix, div)
+        if not in_place:
+            return divided
+        for row, new in zip(matrix, divided):
+            row[:] = new
+        return matrix
+    if in_place:
+        for row in matrix:
+            row[:] = [round(num / div, 2) for num in row]
+        return matrix
+    return [[round(num / div, 2) for num in row] for row in matrix]
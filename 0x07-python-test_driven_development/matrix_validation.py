@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+"""This module holds the checks shared by matrix_mul and matrix_divided
+
+Each matrix is walked once: the same loop checks that the rows are
+lists, that they have the same size and that they only hold integers
+or floats. The callers then raise their own errors, in their own
+order, from what the walk found, and reuse the shape it measured.
+"""
+from collections import namedtuple
+
+NUMBER_TYPES = frozenset((int, float))
+MATRIX_MSG = "matrix must be a matrix (list of lists) of integers/floats"
+SIZE_MSG = "Each row of the matrix must have the same size"
+
+MatrixInfo = namedtuple('MatrixInfo', ['rows', 'cols', 'nonlist_row',
+                                       'bad_size_row', 'bad_type_row',
+                                       'ints_only'])
+MatrixInfo.__doc__ = """Result of scan_matrix
+
+    rows: number of rows
+    cols: size of the first row, None if it is not a list
+    nonlist_row: index of the first row that is not a list, or None
+    bad_size_row: index of the first row whose size is not cols, or None
+    bad_type_row: index of the first row holding something else than
+        an int or a float, or None
+    ints_only: True when every element is an int
+"""
+
+
+def scan_matrix(m):
+    """Walks the rows of the list m once and returns a MatrixInfo
+
+    The walk stops at the first row that is not a list; element types
+    are no longer looked at once a bad one was found.
+    """
+    first = m[0] if m else None
+    cols = len(first) if type(first) is list else None
+    nonlist = bad_size = bad_type = None
+    ints_only = True
+    numbers_only = NUMBER_TYPES.issuperset
+    for i, row in enumerate(m):
+        if type(row) is not list:
+            nonlist = i
+            break
+        if bad_size is None and len(row) != cols:
+            bad_size = i
+        if bad_type is None:
+            types = set(map(type, row))
+            if not numbers_only(types):
+                bad_type = i
+                ints_only = False
+            elif float in types:
+                ints_only = False
+    return MatrixInfo(len(m), cols, nonlist, bad_size, bad_type, ints_only)
+
+
+def check_mul_operands(m_a, m_b):
+    """Raises the TypeError/ValueError of matrix_mul for invalid operands
+
+    Return:
+        (rows of m_a, columns of m_a, columns of m_b, True if both
+        matrices only hold ints)
+    """
+    if type(m_a) is not list:
+        raise TypeError("m_a must be a list")
+    if type(m_b) is not list:
+        raise TypeError("m_b must be a list")
+    if len(m_a) == 0:
+        raise ValueError("m_a can't be empty")
+    a = scan_matrix(m_a)
+    if a.nonlist_row is not None:
+        raise TypeError("m_a must be a list of lists")
+    if a.cols == 0:
+        raise ValueError("m_a can't be empty")
+    b = scan_matrix(m_b)
+    if b.nonlist_row is not None:
+        raise TypeError("m_b must be a list of lists")
+    if b.rows == 0 or b.cols == 0:
+        raise ValueError("m_b can't be empty")
+    if a.bad_size_row is not None:
+        raise TypeError("each row of m_a must be of the same size")
+    if a.bad_type_row is not None:
+        raise TypeError("m_a should contain only integers or floats")
+    if b.bad_size_row is not None:
+        raise TypeError("each row of m_b must be of the same size")
+    if b.bad_type_row is not None:
+        raise TypeError("m_b should contain only integers or floats")
+    if a.cols != b.rows:
+        raise ValueError("m_a and m_b can't be multiplied")
+    return a.rows, a.cols, b.cols, a.ints_only and b.ints_only
+
+
+def check_div(div):
+    """Raises the ZeroDivisionError/TypeError of matrix_divided for div"""
+    if div == 0:
+        raise ZeroDivisionError("division by zero")
+    if type(div) is not int and type(div) is not float:
+        raise TypeError("div must be a number")
+
+
+def check_divided_operands(matrix, div):
+    """Raises the TypeError/ZeroDivisionError of matrix_divided
+
+    Rows are checked in order, and inside a row its type comes first,
+    then its elements, then its size.
+
+    Return:
+        the MatrixInfo of matrix
+    """
+    if type(matrix) is not list or not any(matrix):
+        raise TypeError(MATRIX_MSG)
+    check_div(div)
+    info = scan_matrix(matrix)
+    errors = [(row, rank, msg) for row, rank, msg in (
+        (info.nonlist_row, 0, MATRIX_MSG),
+        (info.bad_type_row, 1, MATRIX_MSG),
+        (info.bad_size_row, 2, SIZE_MSG)) if row is not None]
+    if errors:
+        raise TypeError(min(errors)[2])
+    return info
@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+"""This module holds SparseMatrix, a compressed sparse row (CSR) matrix
+
+Only the elements that are not the int 0 are stored, row after row, so
+a product costs time in proportion to the stored elements instead of
+the full rows * inner size * cols of a dense product.
+"""
+from itertools import compress
+scan_matrix = __import__('matrix_validation').scan_matrix
+MATRIX_MSG = __import__('matrix_validation').MATRIX_MSG
+
+
+class SparseMatrix:
+    """Matrix of ints/floats stored in compressed sparse row form
+
+    Attributes:
+        shape: (rows, cols)
+        indptr: row i is stored in indices/data[indptr[i]:indptr[i + 1]]
+        indices: column of each stored element
+        data: value of each stored element
+        fill: value of the elements that are not stored (0, or 0.0 for
+            a matrix coming out of matrix_divided)
+    """
+
+    def __init__(self, shape, indptr, indices, data, fill=0):
+        self.shape = shape
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.fill = fill
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """Returns the SparseMatrix of a list of lists of ints/floats"""
+        if type(matrix) is not list or not matrix:
+            raise TypeError(MATRIX_MSG)
+        info = scan_matrix(matrix)
+        if info.nonlist_row is not None or info.bad_type_row is not None:
+            raise TypeError(MATRIX_MSG)
+        if info.bad_size_row is not None:
+            raise TypeError("Each row of the matrix must have the same size")
+        return cls.from_rows(matrix, info.ints_only)
+
+    @classmethod
+    def from_rows(cls, matrix, ints_only=False):
+        """Same as from_dense for a matrix that was already validated
+
+        Args:
+            ints_only: True when matrix is known to only hold ints
+        """
+        cols = len(matrix[0])
+        columns = range(cols)
+        indptr = [0]
+        indices = []
+        data = []
+        for row in matrix:
+            if ints_only or all(type(num) is int for num in row):
+                keep = list(compress(columns, row))
+                indices.extend(keep)
+                data.extend([row[j] for j in keep])
+            else:
+                for j, num in enumerate(row):
+                    if num != 0 or type(num) is not int:
+                        indices.append(j)
+                        data.append(num)
+            indptr.append(len(indices))
+        return cls((len(matrix), cols), indptr, indices, data)
+
+    @property
+    def nnz(self):
+        """number of stored elements"""
+        return len(self.data)
+
+    @property
+    def density(self):
+        """fraction of the elements that are stored"""
+        rows, cols = self.shape
+        return self.nnz / (rows * cols)
+
+    def __len__(self):
+        """number of rows"""
+        return self.shape[0]
+
+    def row(self, i):
+        """Returns row i as a new list"""
+        dense = [self.fill] * self.shape[1]
+        start, end = self.indptr[i], self.indptr[i + 1]
+        for j, num in zip(self.indices[start:end], self.data[start:end]):
+            dense[j] = num
+        return dense
+
+    def __iter__(self):
+        """Yields the rows one at a time as lists, so a SparseMatrix can
+        be given to anything that loops over a list of lists
+        """
+        for i in range(self.shape[0]):
+            yield self.row(i)
+
+    def to_dense(self):
+        """Returns the matrix as a list of lists"""
+        return list(self)
+
+    def divided(self, div):
+        """Returns a new SparseMatrix with every element divided by div
+        and rounded to 2 decimals, like matrix_divided
+        """
+        return SparseMatrix(self.shape, self.indptr, self.indices,
+                            [round(num / div, 2) for num in self.data],
+                            round(self.fill / div, 2))
+
+    def multiply(self, other, dense=False):
+        """Returns the product self x other
+
+        Each stored element of a row of self is multiplied by the stored
+        elements of the matching row of other only. Like the dense
+        product, an element is a float when its row of self or its
+        column of other holds a float, an int otherwise.
+
+        Args:
+            other: a SparseMatrix whose rows match the columns of self
+            dense: return a list of lists instead of a SparseMatrix
+        """
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("m_a and m_b can't be multiplied")
+        cols = other.shape[1]
+        b_indptr, b_indices, b_data = other.indptr, other.indices, other.data
+        if type(other.fill) is float:
+            int_row = [0.0] * cols
+        else:
+            int_row = [0] * cols
+            for j, num in zip(b_indices, b_data):
+                if type(num) is float:
+                    int_row[j] = 0.0
+        float_row = [0.0] * cols
+        row_fill_float = type(self.fill) is float
+        product = []
+        for i in range(self.shape[0]):
+            start, end = self.indptr[i], self.indptr[i + 1]
+            data = self.data[start:end]
+            if row_fill_float and end - start < self.shape[1] or \
+                    float in set(map(type, data)):
+                out = float_row[:]
+            else:
+                out = int_row[:]
+            for k, num in zip(self.indices[start:end], data):
+                b_start, b_end = b_indptr[k], b_indptr[k + 1]
+                for j, b_num in zip(b_indices[b_start:b_end],
+                                    b_data[b_start:b_end]):
+                    out[j] += num * b_num
+            product.append(out)
+        if dense:
+            return product
+        return SparseMatrix.from_rows(product)
+
+    def __matmul__(self, other):
+        """self @ other, see multiply"""
+        return self.multiply(other)
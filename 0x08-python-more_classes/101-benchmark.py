@@ -0,0 +1,19 @@
+#!/usr/bin/python3
+"""Times the nqueens search for N=4..14, in one process and in a pool,
+and the count-only search
+"""
+import sys
+from timeit import timeit
+solve = __import__('101-nqueens').solve
+count_solutions = __import__('101-nqueens').count_solutions
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or range(4, 15)
+    for n in sizes:
+        count = len(list(solve(n, workers=1)))
+        t_serial = timeit(lambda: list(solve(n, workers=1)), number=1)
+        t_pool = timeit(lambda: list(solve(n, workers=n)), number=1)
+        t_count = timeit(lambda: count_solutions(n), number=1)
+        print("N={}: {} solutions, 1 process {:.3f}s, pool {:.3f}s, "
+              "count {:.3f}s".format(n, count, t_serial, t_pool, t_count))
@@ -2,61 +2,188 @@
 """
 nqueens backtracking program to print the coordinates of n queens
 on an nxn grid such that they are all in non-attacking positions
+
+Usage: nqueens [--count | --first | --limit K] N
+    --count: only print the number of solutions
+    --first: only print the first solution
+    --limit K: print the first K solutions
+
+The module can also be imported: solve(n) yields the solutions one at
+a time, and the program only prints what it yields.
 """
 
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
 from sys import argv
 
+# below this size the search is faster than starting a process pool
+PARALLEL_MIN_N = 10
+
+
+def search(n, first=None, cancel=None):
+    """backtracking generator that yields the columns of every solution,
+    or of the ones with a queen at [0, first]
+
+    The search is a loop over an explicit stack of one entry per row,
+    so it holds the same O(n) state however many solutions it yields.
+    cols, left and right are bitmasks of the columns attacked in a row
+    by the queens above it, along their column and their two diagonals,
+    and free holds the columns of that row that are left to try.
+    Columns are tried from the lowest one up, so solutions are found in
+    the same order as the row-by-row search.
+    """
+    if n < 1:
+        return
+    full = (1 << n) - 1
+    cols = [0] * n
+    left = [0] * n
+    right = [0] * n
+    free = [0] * n
+    answer = [0] * n
+    free[0] = full if first is None else 1 << first
+    x = 0
+    while x >= 0:
+        if cancel is not None and cancel.is_set():
+            return
+        f = free[x]
+        if not f:  # moves back to the previous x value
+            x -= 1
+            continue
+        bit = f & -f
+        free[x] = f ^ bit
+        answer[x] = bit.bit_length() - 1
+        if x == n - 1:  # accepts the solution
+            yield tuple(answer)
+            continue
+        c = cols[x] | bit
+        lft = (left[x] | bit) << 1 & full
+        rgt = (right[x] | bit) >> 1
+        x += 1  # moves on to next x value to continue
+        cols[x] = c
+        left[x] = lft
+        right[x] = rgt
+        free[x] = full & ~(c | lft | rgt)
+
+
+def count(n, cols, left, right, x):
+    """returns the number of ways to fill rows x to n - 1"""
+    free = ~(cols | left | right) & ((1 << n) - 1)
+    if x == n - 1:
+        return bin(free).count("1")
+    total = 0
+    while free:
+        bit = free & -free
+        free ^= bit
+        total += count(n, cols | bit, (left | bit) << 1, (right | bit) >> 1,
+                       x + 1)
+    return total
+
+
+def solve_from(n, y):
+    """returns the columns of every solution with a queen at [0, y]"""
+    return list(search(n, y))
+
+
+def count_from(n, y):
+    """returns the number of solutions with a queen at [0, y]"""
+    if n == 1:
+        return 1
+    bit = 1 << y
+    return count(n, bit, bit << 1, bit >> 1, 1)
+
+
+def _map_first_row(func, n, workers):
+    """yields func(n, y) for y in the left half of the first row and its
+    middle, in order, the calls running on a pool of processes for
+    larger n
+
+    The other half is the mirror image of the left one.
+    """
+    half = range((n + 1) // 2)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < PARALLEL_MIN_N:
+        for y in half:
+            yield func(n, y)
+        return
+    with ProcessPoolExecutor(min(workers, len(half))) as executor:
+        yield from executor.map(func, [n] * len(half), half)
+
+
+def solve(n, workers=1, cancel=None):
+    """yields the columns of every solution, in the printed order: the
+    queen of row x is at [x, solution[x]]
+
+    Stop the search by closing the generator, or by setting cancel.
+
+    Args:
+        n: size of the board
+        workers: 1 searches lazily in this process. Any other value
+            (None for os.cpu_count()) searches the first row on a pool
+            of processes, only its left half: the solutions with a queen
+            at [0, n - 1 - y] are the mirrors of the ones at [0, y], in
+            reverse order. The solutions of each position are yielded
+            as soon as its search is done, and the ones of the left half
+            are held in memory until their mirrors are yielded.
+        cancel: object with an is_set() method, threading.Event for
+            instance, that stops the search once it is set
+    """
+    if workers == 1:
+        yield from search(n, cancel=cancel)
+        return
+    found = []
+    for solutions in _map_first_row(solve_from, n, workers):
+        found.append(solutions)
+        for solution in solutions:
+            if cancel is not None and cancel.is_set():
+                return
+            yield solution
+    for solutions in reversed(found[:n // 2]):
+        for solution in reversed(solutions):
+            if cancel is not None and cancel.is_set():
+                return
+            yield tuple(n - 1 - x for x in solution)
+
+
+def count_solutions(n, workers=None):
+    """returns the number of solutions, searching half of the first row
+    on a pool of processes like solve
+    """
+    counts = list(_map_first_row(count_from, n, workers))
+    return 2 * sum(counts[:n // 2]) + sum(counts[n // 2:])
+
+
+def usage():
+    """prints the usage and exits"""
+    print("Usage: nqueens N")
+    exit(1)
+
+
 if __name__ == "__main__":
-    a = []
-    if len(argv) != 2:
-        print("Usage: nqueens N")
-        exit(1)
-    if argv[1].isdigit() is False:
+    args = argv[1:]
+    mode = None
+    if args and args[0] in ("--count", "--first", "--limit"):
+        mode = args.pop(0)
+    if mode == "--limit":
+        if not args or args[0].isdigit() is False:
+            usage()
+        limit = int(args.pop(0))
+    if len(args) != 1:
+        usage()
+    if args[0].isdigit() is False:
         print("N must be a number")
         exit(1)
-    n = int(argv[1])
+    n = int(args[0])
     if n < 4:
         print("N must be at least 4")
         exit(1)
 
-    # initialize the answer list
-    for i in range(n):
-        a.append([i, None])
-
-    def already_exists(y):
-        """check that a queen does not already exist in that y value"""
-        for x in range(n):
-            if y == a[x][1]:
-                return True
-        return False
-
-    def reject(x, y):
-        """determines whether or not to reject the solution"""
-        if (already_exists(y)):
-            return False
-        i = 0
-        while(i < x):
-            if abs(a[i][1] - y) == abs(i - x):
-                return False
-            i += 1
-        return True
-
-    def clear_a(x):
-        """clears the answers from the point of failure on"""
-        for i in range(x, n):
-            a[i][1] = None
-
-    def nqueens(x):
-        """recursive backtracking function to find the solution"""
-        for y in range(n):
-            clear_a(x)
-            if reject(x, y):
-                a[x][1] = y
-                if (x == n - 1):  # accepts the solution
-                    print(a)
-                else:
-                    nqueens(x + 1)  # moves on to next x value to continue
-
-    # start the recursive process at x = 0
-    nqueens(0)
+    if mode == "--count":
+        print(count_solutions(n))
+    else:
+        solutions = solve(n)
+        if mode is not None:
+            solutions = islice(solutions, 1 if mode == "--first" else limit)
+        for solution in solutions:
+            print([[x, y] for x, y in enumerate(solution)])
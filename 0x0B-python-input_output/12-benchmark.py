@@ -0,0 +1,28 @@
+#!/usr/bin/python3
+"""Times pascal_row, pascal_row_mod and the streamed rows for n=1,000
+to 20,000, and pascal_triangle for the sizes that fit in memory
+"""
+import sys
+from collections import deque
+from timeit import timeit
+pascal = __import__('12-pascal_triangle')
+
+TRIANGLE_MAX_N = 2000
+P = 1000003
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]]
+    sizes = sizes or [1000, 2000, 5000, 10000, 20000]
+    for n in sizes:
+        t_row = timeit(lambda: pascal.pascal_row(n), number=1)
+        t_mod = timeit(lambda: pascal.pascal_row_mod(n, P), number=1)
+        t_stream = timeit(lambda: deque(pascal.pascal_rows(n), 1),
+                          number=1)
+        print("n={}: pascal_row {:.3f}s, pascal_row_mod {:.3f}s, "
+              "pascal_rows {:.3f}s".format(n, t_row, t_mod, t_stream),
+              end="")
+        if n <= TRIANGLE_MAX_N:
+            t_tri = timeit(lambda: pascal.pascal_triangle(n), number=1)
+            print(", pascal_triangle {:.3f}s".format(t_tri), end="")
+        print()
@@ -1,18 +1,101 @@
 #!/usr/bin/python3
 """ Module pascal triangle
 """
+from operator import add
+
+
+def pascal_rows(n):
+    """ Yields the first n rows of pascal triangle, one at a time,
+    only keeping the previous row """
+    row = [1]
+    for i in range(n):
+        yield row
+        row = [1] + list(map(add, row, row[1:])) + [1]
 
 
 def pascal_triangle(n):
     """ Prints pascal triangle """
     if n <= 0:
         return []
-    triangle = []
-    row = []
-    for i in range(n):
-        row = [1]
-        if i > 0:
-            for j in range(i):
-                row.append(sum(triangle[-1][j:j+2]))
-        triangle.append(row)
-    return triangle
+    return list(pascal_rows(n))
+
+
+def pascal_row(n):
+    """ Returns row n of pascal triangle (the last row of
+    pascal_triangle(n + 1)), from C(n, k) = C(n, k - 1) * (n - k + 1) / k
+    """
+    if n < 0:
+        return []
+    half = [1]
+    c = 1
+    for k in range(1, n // 2 + 1):
+        c = c * (n - k + 1) // k
+        half.append(c)
+    return half + half[n % 2 - 2::-1]
+
+
+def pascal_row_mod(n, p):
+    """ Returns row n of pascal triangle modulo p >= 2
+
+    For a prime p, below p C(n, k) = C(n, k - 1) * (n - k + 1) / k with
+    the inverses of 1..n modulo p. From p on, Lucas's theorem gives
+    C(n, k) as the product of C(n_i, k_i) over the base p digits n_i and
+    k_i of n and k, so the row is built from the rows of the digits of n.
+    Any other p reduces the exact row.
+    """
+    if p < 2:
+        raise ValueError("p must be >= 2")
+    if n < 0:
+        return []
+    if not _is_prime(p):
+        return [c % p for c in pascal_row(n)]
+    digits = []
+    rest = n
+    while True:
+        digits.append(rest % p)
+        rest //= p
+        if rest == 0:
+            break
+    row = _small_row_mod(digits.pop(), p)
+    while digits:
+        d = digits.pop()
+        block = _small_row_mod(d, p) + [0] * (p - 1 - d)
+        row = [c * b % p for c in row for b in block]
+    return row[:n + 1]
+
+
+def _small_row_mod(n, p):
+    """ Returns row n < p of pascal triangle modulo p """
+    inverse = [0, 1]
+    for k in range(2, n + 1):
+        inverse.append((p - p // k) * inverse[p % k] % p)
+    row = [1]
+    c = 1
+    for k in range(1, n + 1):
+        c = c * (n - k + 1) * inverse[k] % p
+        row.append(c)
+    return row
+
+
+def _is_prime(p):
+    """ Miller-Rabin test, exact for p < 3.3 * 10 ** 24 """
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    if p in bases:
+        return True
+    if any(p % b == 0 for b in bases):
+        return False
+    d, s = p - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for b in bases:
+        x = pow(b, d, p)
+        if x in (1, p - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % p
+            if x == p - 1:
+                break
+        else:
+            return False
+    return True
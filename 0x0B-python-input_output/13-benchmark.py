@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+"""Compares the memory and to_json throughput of the __dict__ Student
+of 11-student.py with the slotted one of 13-student.py
+"""
+import sys
+import tracemalloc
+from timeit import timeit
+DictStudent = __import__('11-student').Student
+slotted = __import__('13-student')
+SlotStudent = slotted.Student
+to_json_many = slotted.to_json_many
+
+ATTRS = ["first_name", "age"]
+
+
+def build(cls, count):
+    """returns count students of cls and the bytes they take"""
+    tracemalloc.start()
+    students = [cls("John", "Doe", i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return students, size
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    old, old_size = build(DictStudent, count)
+    new, new_size = build(SlotStudent, count)
+    print("{} students: __dict__ {:.1f} MB, __slots__ {:.1f} MB".format(
+        count, old_size / 10 ** 6, new_size / 10 ** 6))
+    t_old = timeit(lambda: [s.to_json(ATTRS) for s in old], number=1)
+    t_new = timeit(lambda: [s.to_json(ATTRS) for s in new], number=1)
+    t_many = timeit(lambda: to_json_many(new, ATTRS), number=1)
+    print("to_json({}): __dict__ {:.3f}s, __slots__ {:.3f}s, "
+          "to_json_many {:.3f}s".format(ATTRS, t_old, t_new, t_many))
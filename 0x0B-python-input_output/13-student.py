@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""class Student, stored in __slots__ instead of a __dict__
+
+to_json(attrs) goes through a projection built once per attrs: the
+fields to keep are worked out once and read with a single attrgetter.
+"""
+from functools import lru_cache
+from operator import attrgetter
+
+FIELDS = ("first_name", "last_name", "age")
+
+
+def _compile(names):
+    """returns a function that gives the dictionary of
+    the fields names of a student
+    """
+    if not names:
+        return lambda student: {}
+    if len(names) == 1:
+        name = names[0]
+        getter = attrgetter(name)
+        return lambda student: {name: getter(student)}
+    getter = attrgetter(*names)
+    return lambda student: dict(zip(names, getter(student)))
+
+
+@lru_cache(maxsize=256)
+def _projection(attrs):
+    """builds the projection of the fields of attrs, in the order of FIELDS"""
+    return _compile(tuple(name for name in FIELDS if name in attrs))
+
+
+def projection(attrs=None):
+    """Returns the function that to_json(attrs) applies to
+    a student, built once for each attrs
+    """
+    if attrs is None:
+        attrs = FIELDS
+    elif type(attrs) is list:
+        attrs = tuple(attrs)
+    try:
+        return _projection(attrs)
+    except TypeError:  # attrs is or holds something that is not hashable
+        return _compile(tuple(name for name in FIELDS if name in attrs))
+
+
+def to_json_many(students, attrs=None):
+    """Returns the list of student.to_json(attrs) of students"""
+    return list(map(projection(attrs), students))
+
+
+class Student:
+    """class Student"""
+
+    __slots__ = FIELDS
+
+    def __init__(self, first_name, last_name, age):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.age = age
+
+    def to_json(self, attrs=None):
+        """Public method to retrieve a dictionary representation
+            of a student instance, a new one on each call
+        """
+        return projection(attrs)(self)
+
+    def reload_from_json(self, json):
+        """Replaces the attributes of the Student instance
+        Args:
+            json (dict): first_name, last_name and/or age, other keys
+                are ignored since there is no slot to hold them
+        """
+        if json:
+            for key in FIELDS:
+                if key in json:
+                    setattr(self, key, json[key])
@@ -1,12 +1,183 @@
 #!/usr/bin/python3
 """Module write object with json
+
+The file is written to a temporary file in the same directory, then
+renamed over filename, so it is never left half written. Saves can also
+be handed to a write-behind queue that only writes the latest one.
 """
+import atexit
 import json
+import logging
+import os
+import secrets
+import threading
+
+MAX_RETRY_DELAY = 5.0
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindError(Exception):
+    """error of WriteBehind.flush, errors holds the
+    (filename, exception) of every failed write
+    """
+
+    def __init__(self, errors):
+        super().__init__("could not write " +
+                         ", ".join(name for name, _ in errors))
+        self.errors = errors
+
+
+def atomic_write(filename, text, fsync=False):
+    """function that replaces the content of filename
+    with text, in a single rename
+    """
+    directory, name = os.path.split(os.path.abspath(filename))
+    while True:
+        tmp = os.path.join(directory, ".{}.{}.tmp".format(
+            name, secrets.token_hex(4)))
+        try:
+            # 0o666 like open(filename, 'w'), so the umask applies
+            fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        try:
+            os.chmod(tmp, os.stat(filename).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        with open(fd, mode='w', encoding="utf-8") as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, filename)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class WriteBehind:
+    """queue of saves written in the background, where
+    successive saves of a file are written once
+
+    A file that could not be written is retried, waiting
+    twice as long after each failed run, up to MAX_RETRY_DELAY.
+    """
 
+    def __init__(self, delay=0.05, fsync=False):
+        self.delay = delay
+        self.fsync = fsync
+        self.__lock = threading.Lock()
+        self.__write_lock = threading.Lock()
+        self.__pending = {}
+        self.__timer = None
+        self.__retry_delay = delay
+        self.__errors = {}
+        atexit.register(self.__flush_at_exit)
 
-def save_to_json_file(my_obj, filename):
+    def __schedule(self, delay):
+        """starts the timer of the next write, lock held"""
+        if self.__timer is None:
+            self.__timer = threading.Timer(delay, self.__run)
+            self.__timer.daemon = True
+            self.__timer.start()
+
+    def submit(self, filename, text):
+        """records text as the next content of filename
+        and starts the timer of the next write
+        """
+        with self.__lock:
+            self.__pending[filename] = text
+            self.__schedule(self.delay)
+
+    def __write(self):
+        """writes the pending files, and returns the exception
+        of every failed write by filename
+
+        A file that could not be written stays pending unless
+        a newer text was submitted for it meanwhile, and is
+        retried by the timer.
+        """
+        with self.__write_lock:
+            with self.__lock:
+                pending, self.__pending = self.__pending, {}
+                if self.__timer is not None:
+                    self.__timer.cancel()
+                    self.__timer = None
+            errors = {}
+            for filename, text in pending.items():
+                try:
+                    atomic_write(filename, text, self.fsync)
+                except Exception as e:
+                    errors[filename] = e
+            with self.__lock:
+                for filename in pending:
+                    if filename in errors:
+                        self.__pending.setdefault(filename,
+                                                  pending[filename])
+                    else:
+                        self.__errors.pop(filename, None)
+                if errors:
+                    self.__retry_delay = min(2 * self.__retry_delay,
+                                             MAX_RETRY_DELAY)
+                    self.__schedule(self.__retry_delay)
+                else:
+                    self.__retry_delay = self.delay
+        return errors
+
+    def __run(self):
+        errors = self.__write()
+        with self.__lock:
+            self.__errors.update(errors)
+
+    def flush(self):
+        """writes the pending files now, and raises a
+        WriteBehindError with the last error of every file
+        that could not be written, in the background since
+        the previous flush or now
+        """
+        errors = self.__write()
+        with self.__lock:
+            reported, self.__errors = self.__errors, {}
+        reported.update(errors)
+        if reported:
+            raise WriteBehindError(list(reported.items()))
+
+    def __flush_at_exit(self):
+        """flush run at exit, logs the errors instead of raising"""
+        try:
+            self.flush()
+        except WriteBehindError as e:
+            for filename, error in e.errors:
+                logger.error("could not write %s: %s", filename, error)
+
+
+write_behind = WriteBehind()
+
+
+def save_to_json_file(my_obj, filename, fsync=False, later=False):
     """function that writes an object to a
     text file, using a JSON representation
+
+    fsync waits until the file is on disk. later only encodes
+    my_obj now and leaves the write to write_behind.
     """
-    with open(filename, mode='w', encoding="utf-8") as f:
-        f.write(json.dumps(my_obj))
+    if later:
+        write_behind.submit(filename, json.dumps(my_obj))
+    else:
+        atomic_write(filename, json.dumps(my_obj), fsync)
+
+
+def flush():
+    """function that writes the saves left to write_behind"""
+    write_behind.flush()
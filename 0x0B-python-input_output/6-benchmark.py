@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+"""Times the JSON loaders on generated files of about 100 MB: one JSON
+array on a single line, the same array pretty-printed, and JSON Lines
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+from collections import deque
+from timeit import timeit
+loader = __import__('6-load_from_json_file')
+
+
+def line_by_line(filename):
+    """the previous loader: one json.loads per line, last one kept"""
+    with open(filename, encoding='utf-8') as f:
+        for line in f:
+            new = json.loads(line)
+    return new
+
+
+if __name__ == "__main__":
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    record = {"id": 0, "name": "Holberton School", "scores": [1, 2.5, 3],
+              "active": True, "city": "San Francisco"}
+    count = megabytes * 10 ** 6 // len(json.dumps(record))
+    items = [dict(record, id=i) for i in range(count)]
+    directory = tempfile.mkdtemp()
+    try:
+        compact = os.path.join(directory, "compact.json")
+        pretty = os.path.join(directory, "pretty.json")
+        lines = os.path.join(directory, "lines.jsonl")
+        with open(compact, "w", encoding="utf-8") as f:
+            json.dump(items, f)
+        with open(pretty, "w", encoding="utf-8") as f:
+            json.dump(items, f, indent=2)
+        with open(lines, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(item) + "\n" for item in items)
+        del items
+        for name in (compact, pretty, lines):
+            print("{}: {:.0f} MB".format(os.path.basename(name),
+                                         os.path.getsize(name) / 10 ** 6))
+        print("line by line, single line: {:.2f}s".format(
+            timeit(lambda: line_by_line(compact), number=1)))
+        for name in (compact, pretty):
+            print("load_from_json_file, {}: {:.2f}s".format(
+                os.path.basename(name),
+                timeit(lambda: loader.load_from_json_file(name), number=1)))
+            print("iter_json_file, {}: {:.2f}s".format(
+                os.path.basename(name),
+                timeit(lambda: deque(loader.iter_json_file(name), 0),
+                       number=1)))
+        print("iter_json_file lines=True: {:.2f}s".format(
+            timeit(lambda: deque(loader.iter_json_file(lines, True), 0),
+                   number=1)))
+    finally:
+        shutil.rmtree(directory)
@@ -2,13 +2,96 @@
 """Module create obj from json
 """
 import json
+import re
+
+CHUNK_SIZE = 1 << 16
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = "0123456789+-.eE"
 
 
 def load_from_json_file(filename):
     """function that creates an object
     from a "JSON file"
     """
+    with open(filename, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def iter_json_file(filename, lines=False, chunk_size=CHUNK_SIZE):
+    """generator that yields the elements of the JSON
+    array in filename one at a time, or the object of each
+    line when lines is True (JSON Lines), without holding
+    the whole file in memory
+    """
+    if lines:
+        return _iter_lines(filename)
+    return _iter_array(filename, chunk_size)
+
+
+def _iter_lines(filename):
+    """yields the object of each non blank line of filename"""
     with open(filename, encoding='utf-8') as f:
         for line in f:
-            new = json.loads(line)
-    return new
+            if line.strip():
+                yield json.loads(line)
+
+
+def _iter_array(filename, chunk_size):
+    """reads filename chunk_size characters at a time and decodes
+    each element with raw_decode as soon as it is complete
+    """
+    with open(filename, encoding='utf-8') as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def more(buf, pos):
+            """drops what was decoded and reads one more chunk, or as
+            much as is buffered so a big element is not decoded again
+            once per chunk"""
+            buf = buf[pos:]
+            chunk = f.read(max(chunk_size, len(buf)))
+            return buf + chunk, 0, not chunk
+
+        expect = "["
+        while True:
+            pos = _whitespace.match(buf, pos).end()
+            if pos == len(buf):
+                if eof:
+                    raise ValueError("Unexpected end of JSON array")
+                buf, pos, eof = more(buf, pos)
+                continue
+            if expect == "[":
+                if buf[pos] != "[":
+                    raise ValueError("JSON file is not an array")
+                pos += 1
+                expect = "first"
+                continue
+            if buf[pos] == "]" and expect != "value":
+                return
+            if expect == ",":
+                if buf[pos] != ",":
+                    raise ValueError("Expecting ',' delimiter")
+                pos += 1
+                expect = "value"
+                continue
+            try:
+                value, end = _decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise
+                buf, pos, eof = more(buf, pos)
+                continue
+            # a number cut at the end of the buffer decodes as a
+            # shorter one: only accept it once something follows it
+            tail = end
+            while tail < len(buf) and buf[tail] in _NUMBER_CHARS:
+                tail += 1
+            if tail == len(buf) and not eof and \
+                    type(value) in (int, float):
+                buf, pos, eof = more(buf, pos)
+                continue
+            yield value
+            pos = end
+            expect = ","
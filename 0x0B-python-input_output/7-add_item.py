@@ -1,16 +1,92 @@
 #!/usr/bin/python3
-"""script that adds all args to a python list"""
+"""script that adds all args to a python list
 
+The args are appended as one JSON line to add_item.jsonl, under an
+exclusive lock, instead of rewriting add_item.json on every call. Once
+the log grows past COMPACT_SIZE bytes it is folded into add_item.json
+and emptied. load_items returns the whole list: add_item.json followed
+by the log.
+"""
 
+
+import fcntl
+import json
+import os
 import sys
-if __name__ == "__main__":
-    save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
-    load_from_json_file = \
-        __import__('6-load_from_json_file').load_from_json_file
+save_to_json_file = __import__('5-save_to_json_file').save_to_json_file
+load_from_json_file = \
+    __import__('6-load_from_json_file').load_from_json_file
+
+FILENAME = "add_item.json"
+LOG = "add_item.jsonl"
+COMPACT_SIZE = 64 * 1024
+
+
+def _load_list(filename):
+    """returns the list saved in filename, [] if there is none"""
+    try:
+        return load_from_json_file(filename)
+    except FileNotFoundError:
+        return []
+
+
+def _read_log(f):
+    """returns the items of every line of the log f
+
+    A line that is not valid JSON was cut off by an interrupted append
+    and is skipped.
+    """
+    items = []
+    f.seek(0)
+    for line in f:
+        try:
+            items.extend(json.loads(line))
+        except ValueError:
+            pass
+    return items
 
+
+def _compact(f, filename):
+    """folds the log f into filename, the caller holds the lock"""
+    save_to_json_file(_load_list(filename) + _read_log(f), filename)
+    f.truncate(0)
+
+
+def load_items(filename=FILENAME, log=LOG):
+    """returns the items of filename followed by the ones of log"""
     try:
-        objNew = load_from_json_file("add_item.json")
+        f = open(log, mode='rb')
     except FileNotFoundError:
-        objNew = []
-    objNew.extend(sys.argv[1:])
-    save_to_json_file(objNew, "add_item.json")
+        return _load_list(filename)
+    with f:
+        fcntl.flock(f, fcntl.LOCK_SH)
+        return _load_list(filename) + _read_log(f)
+
+
+def add_items(items, filename=FILENAME, log=LOG, compact_size=COMPACT_SIZE):
+    """appends items to log, and compacts it once it reaches
+    compact_size bytes or when filename does not exist yet
+    """
+    line = json.dumps(items).encode("utf-8") + b"\n"
+    with open(log, mode='a+b') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+        f.flush()
+        if size + len(line) >= compact_size or not os.path.exists(filename):
+            _compact(f, filename)
+
+
+def compact(filename=FILENAME, log=LOG):
+    """folds log into filename now"""
+    with open(log, mode='a+b') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        _compact(f, filename)
+
+
+if __name__ == "__main__":
+    add_items(sys.argv[1:])
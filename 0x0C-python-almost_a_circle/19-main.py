@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+""" 19-main: objects per second of create vs create_many """
+from timeit import timeit
+from models.rectangle import Rectangle
+from models.square import Square
+
+if __name__ == "__main__":
+
+    n = 100000
+    for cls, d in ((Rectangle, {'id': 1, 'width': 3, 'height': 4,
+                                'x': 1, 'y': 2}),
+                   (Square, {'id': 1, 'size': 3, 'x': 1, 'y': 2})):
+        rows = [d] * n
+        t_create = timeit(lambda: [cls.create(**x) for x in rows], number=1)
+        t_many = timeit(lambda: cls.create_many(rows), number=1)
+        print("{} create:      {:>10.0f} objects/s".format(
+            cls.__name__, n / t_create))
+        print("{} create_many: {:>10.0f} objects/s".format(
+            cls.__name__, n / t_many))
+
+    try:
+        Rectangle.create_many([{'width': 0}, {'width': 2}, {'x': "1"}])
+    except ValueError as e:
+        print(e)
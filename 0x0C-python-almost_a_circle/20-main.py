@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+""" 20-main: GridIndex queries against a linear scan
+
+usage: ./20-main.py [N ...]   (default sizes: 10000 100000)
+"""
+import random
+import sys
+from timeit import timeit
+from models.rectangle import Rectangle
+from models.spatial_index import GridIndex
+
+if __name__ == "__main__":
+
+    sizes = [int(n) for n in sys.argv[1:]] or [10000, 100000]
+    random.seed(0)
+    for n in sizes:
+        side = int(n ** 0.5) * 8
+        shapes = [Rectangle(random.randint(1, 8), random.randint(1, 8),
+                            random.randint(0, side), random.randint(0, side),
+                            i + 1) for i in range(n)]
+        index = GridIndex(16)
+        t_build = timeit(lambda: [index.insert(s) for s in shapes], number=1)
+        points = [(random.randint(0, side), random.randint(0, side))
+                  for i in range(100)]
+
+        def scan_point():
+            for px, py in points:
+                [s for s in shapes if s.x <= px < s.x + s.width and
+                 s.y <= py < s.y + s.height]
+
+        def scan_window():
+            for px, py in points:
+                [s for s in shapes if s.x < px + 32 and px < s.x + s.width
+                 and s.y < py + 32 and py < s.y + s.height]
+
+        t_point = timeit(lambda: [index.query_point(*p) for p in points],
+                         number=1)
+        t_window = timeit(lambda: [index.query_window(px, py, px + 32,
+                                                      py + 32)
+                                   for px, py in points], number=1)
+        t_near = timeit(lambda: [index.nearest(px, py, 5)
+                                 for px, py in points], number=1)
+        print("n={} build {:.3f}s".format(n, t_build))
+        print("  point:  grid {:.5f}s  scan {:.5f}s".format(
+            t_point, timeit(scan_point, number=1)))
+        print("  window: grid {:.5f}s  scan {:.5f}s".format(
+            t_window, timeit(scan_window, number=1)))
+        far = [(side * 1000, 0), (-side * 1000, side * 1000)]
+        t_far = timeit(lambda: [index.nearest(px, py, 5) for px, py in far],
+                       number=1)
+        print("  nearest(k=5): grid {:.5f}s".format(t_near))
+        print("  nearest(k=5), far points: grid {:.5f}s".format(t_far))
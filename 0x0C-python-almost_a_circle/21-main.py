@@ -0,0 +1,26 @@
+#!/usr/bin/python3
+""" 21-main: cost of validated vs trusted construction """
+from timeit import repeat
+from models.rectangle import Rectangle
+from models.square import Square
+
+if __name__ == "__main__":
+
+    r = Rectangle(1, 1)
+    s = Square(1)
+    n = 100000
+    for label, stmt in (("Rectangle(...)", "Rectangle(3, 4, 1, 2, 1)"),
+                        ("r.update(**kw)",
+                         "r.update(width=3, height=4, x=1, y=2)"),
+                        ("s.update(*args)", "s.update(1, 3, 1, 2)"),
+                        ("s.size = 5", "s.size = 5"),
+                        ("r.width = 5", "r.width = 5")):
+        t = min(repeat(stmt, globals=globals(), number=n, repeat=5))
+        print("{:26} {:6.0f} ns".format(label, t / n * 1e9))
+
+    rows = [{'id': 1, 'width': 3, 'height': 4, 'x': 1, 'y': 2}] * n
+    for trusted in (False, True):
+        t = min(repeat(lambda: Rectangle.create_many(rows, trusted),
+                       number=1, repeat=3))
+        print("create_many(trusted={}) {:6.0f} ns".format(trusted,
+                                                          t / n * 1e9))
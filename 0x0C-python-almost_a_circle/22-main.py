@@ -0,0 +1,31 @@
+#!/usr/bin/python3
+""" 22-main: times save/load_from_file_sharded with 1, 2, 4 and 8 shards
+
+The files are written to a temporary directory.
+
+usage: ./22-main.py [N]   (default: 200000 rectangles)
+"""
+import os
+import sys
+import tempfile
+from timeit import timeit
+from models.rectangle import Rectangle
+
+if __name__ == "__main__":
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    shapes = [Rectangle(i % 8 + 1, i % 5 + 1, i % 3, i % 7, i + 1)
+              for i in range(n)]
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        t_save = timeit(lambda: Rectangle.save_to_file(shapes), number=1)
+        t_load = timeit(Rectangle.load_from_file, number=1)
+        print("{} rectangles, one file: save {:.2f}s, load {:.2f}s".format(
+            n, t_save, t_load))
+        for shards in (1, 2, 4, 8):
+            t = timeit(lambda: Rectangle.save_to_file_sharded(shapes, shards),
+                       number=1)
+            u = timeit(Rectangle.load_from_file_sharded, number=1)
+            print("{} rectangles, {} shards: save {:.2f}s ({:.1f}x), "
+                  "load {:.2f}s ({:.1f}x)".format(
+                      n, shards, t, t_save / t, u, t_load / u))
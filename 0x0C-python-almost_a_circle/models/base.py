@@ -3,21 +3,176 @@
 Class base Module
 """
 
+import csv
 import json
+import os
+from itertools import islice
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from models.id_allocator import IdAllocator
+from models.persistence import atomic_open, atomic_write, write_behind
+
+
+SHARD_MIN_SIZE = 10000
+
+
+def _to_int(value):
+    """returns the int written in value, or value when it is not one"""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def write_json_shard(filename, keys, rows):
+    """writes one shard of a sharded save, run in a worker process
+
+    args:
+        keys: names of the values of each row, or None when rows
+            already are dictionaries
+        rows: tuples of values in the order of keys
+    """
+    if keys is not None:
+        rows = [dict(zip(keys, row)) for row in rows]
+    with atomic_open(filename, 'w') as f:
+        f.write(json.dumps(rows))
+    return len(rows)
+
+
+def read_json_shard(cls, filename, trusted=False):
+    """reads and checks one shard of a sharded save, run in a worker
+    process
+
+    returns:
+        (columns, errors, extras): the columns of the shard as given by
+        cls.columns_from_rows, the (row, message) of its invalid rows
+        and the (row, dict) given by cls.row_extras
+    """
+    with open(filename, mode='r') as f:
+        rows = json.loads(f.read())
+    columns = cls.columns_from_rows(rows)
+    errors = None if trusted else cls.column_errors(columns)
+    extras = cls.row_extras(rows, errors)
+    if errors:
+        errors.sort(key=lambda e: e[0])
+    return columns, errors or [], extras
 
 
 class Base:
-    """ base Class """
-    __nb_objects = 0
+    """ base Class
+
+    Subclasses declare their validated integer attributes once in
+    constraints, as (name, minimum) pairs, and may map extra public
+    names to them in aliases. When the class is created they are
+    compiled into its plan and into one property per attribute whose
+    setter does the whole check itself, with the error messages
+    already formatted.
+    """
+    __ids = IdAllocator()
+    plan = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """compiles the constraints and aliases of cls
+
+        Each plan entry is (storage names, minimum, label).
+        """
+        super().__init_subclass__(**kwargs)
+        plan = dict(cls.plan)
+        for name, minimum in vars(cls).get('constraints', ()):
+            plan[name] = (('_{}__{}'.format(cls.__name__, name),), minimum,
+                          name)
+        for alias, names in vars(cls).get('aliases', {}).items():
+            storage = tuple(a for name in names for a in plan[name][0])
+            plan[alias] = (storage,) + plan[names[0]][1:]
+        for name in plan.keys() - cls.plan.keys():
+            setattr(cls, name, Base.compile_property(*plan[name]))
+        cls.plan = plan
+
+    @staticmethod
+    def compile_property(storage, minimum, label):
+        """returns a property validating and storing an integer attribute
+
+        args:
+            storage: names of the instance attributes holding the value
+            minimum: smallest accepted value
+            label: attribute name used in the error messages
+        """
+        type_msg, value_msg = Base.plan_messages(minimum, label)
+        if len(storage) == 1:
+            attr = storage[0]
+
+            def setter(self, value):
+                """validates and stores value"""
+                if type(value) is not int:
+                    raise TypeError(type_msg)
+                if value < minimum:
+                    raise ValueError(value_msg)
+                self.__dict__[attr] = value
+        else:
+            def setter(self, value):
+                """validates value once and stores it in every attribute"""
+                if type(value) is not int:
+                    raise TypeError(type_msg)
+                if value < minimum:
+                    raise ValueError(value_msg)
+                attrs = self.__dict__
+                for attr in storage:
+                    attrs[attr] = value
+        return property(attrgetter(storage[0]), setter,
+                        doc='{} (int >= {})'.format(label, minimum))
+
+    @staticmethod
+    def plan_messages(minimum, label):
+        """returns the (TypeError, ValueError) messages of a plan entry"""
+        return ('{} must be an integer'.format(label),
+                '{} must be {}'.format(label, '> 0' if minimum else '>= 0'))
 
     def __init__(self, id=None):
         """initiation method"""
 
         if id is not None:
-            self.id = id
+            Base.__ids.register(self, id)
+            self.__id = id
         else:
-            Base.__nb_objects += 1
-            self.id = Base.__nb_objects
+            self.__id = Base.__ids.allocate()
+            Base.__ids.register(self, self.__id, explicit=False)
+
+    @property
+    def id(self):
+        """id getter method"""
+        return self.__id
+
+    @id.setter
+    def id(self, value):
+        """id setter method, reserves value so it is never allocated"""
+        if self.__dict__.get('_Base__id', None) != value:
+            Base.__ids.register(self, value)
+        self.__id = value
+
+    @staticmethod
+    def track_ids(enabled=True):
+        """starts (or stops) registering the instances created from now
+        on, so get_by_id can find them
+        """
+        Base.__ids.track(enabled)
+
+    @staticmethod
+    def get_by_id(id):
+        """returns the live instance with this id, or None
+
+        Only instances created while track_ids() is on can be found.
+        """
+        return Base.__ids.lookup(id)
+
+    @staticmethod
+    def partition_ids(index, count):
+        """gives this process its own share of ids
+
+        args:
+            index: number of this worker, from 0 to count - 1
+            count: number of worker processes creating instances
+        """
+        Base.__ids.partition(index, count)
 
     def integer_validator(self, name, value):
         """ check if value is an integer """
@@ -33,20 +188,175 @@ class Base:
         if value < 0:
             raise ValueError('{} must be >= 0'.format(name))
 
+    @staticmethod
+    def column_validator(name, values, minimum, errors):
+        """ checks a whole column of values at once
+
+        args:
+            name: attribute name used in the error messages
+            values: list of values, one per row
+            minimum: smallest accepted value (0 or 1)
+            errors: list where (row, message) pairs are appended
+        """
+        if all(type(v) is int for v in values) and \
+                (not values or min(values) >= minimum):
+            return
+        for row, value in enumerate(values):
+            if type(value) is not int:
+                errors.append((row, '{} must be an integer'.format(name)))
+            elif value < minimum:
+                bound = '> 0' if minimum else '>= 0'
+                errors.append((row, '{} must be {}'.format(name, bound)))
+
+    @classmethod
+    def columns_from_rows(cls, rows):
+        """returns one list per field of cls, taken from a list of dicts
+
+        Missing attributes take their smallest accepted value, like the
+        dummy instance used by create().
+        """
+        return {name: [d.get(name, cls.plan[name][1] if name in cls.plan
+                             else None) for d in rows]
+                for name in cls.fields}
+
+    @classmethod
+    def column_errors(cls, columns):
+        """returns the (row, message) of every invalid value of columns,
+        sorted by row
+        """
+        errors = []
+        for name in cls.fields:
+            if name in cls.plan:
+                _, minimum, label = cls.plan[name]
+                cls.column_validator(label, columns[name], minimum, errors)
+        errors.sort(key=lambda e: e[0])
+        return errors
+
+    @staticmethod
+    def invalid_rows(errors):
+        """returns the ValueError listing the (row, message) of errors"""
+        return ValueError('invalid rows:\n' + '\n'.join(
+            'row {}: {}'.format(row, msg) for row, msg in errors))
+
+    @classmethod
+    def create_from_columns(cls, columns, trusted=False):
+        """return a list of instances built from one list per field
+
+        Each attribute is validated once for the whole column, and the
+        instances are filled in directly instead of going through a
+        dummy instance and update().
+
+        args:
+            columns: dict mapping every name of cls.fields to a list
+            trusted: skip validation, for data that was already checked
+        raises:
+            ValueError: listing every invalid row
+        """
+        if not trusted:
+            errors = cls.column_errors(columns)
+            if errors:
+                raise cls.invalid_rows(errors)
+        names = [name for name in cls.fields if name in cls.plan]
+        storage = [cls.plan[name][0] for name in names]
+        objs = []
+        for id, *values in zip(columns['id'],
+                               *[columns[name] for name in names]):
+            obj = cls.__new__(cls)
+            Base.__init__(obj, id)
+            attrs = obj.__dict__
+            for attr_names, value in zip(storage, values):
+                for attr in attr_names:
+                    attrs[attr] = value
+            objs.append(obj)
+        return objs
+
+    @classmethod
+    def create_many(cls, dictionaries, trusted=False):
+        """return a list of instances built from a list of dictionaries
+
+        args:
+            dictionaries: iterable of dicts as produced by to_dictionary
+            trusted: skip validation, for data that was already checked
+        raises:
+            ValueError: listing every invalid row
+        """
+        rows = list(dictionaries)
+        columns = cls.columns_from_rows(rows)
+        errors = None if trusted else cls.column_errors(columns)
+        extras = cls.row_extras(rows, errors)
+        if errors:
+            errors.sort(key=lambda e: e[0])
+            raise cls.invalid_rows(errors)
+        objs = cls.create_from_columns(columns, trusted=True)
+        for row, d in extras:
+            obj = objs[row]
+            for key, value in d.items():
+                setattr(obj, key, value)
+        return objs
+
+    @classmethod
+    def row_extras(cls, rows, errors=None):
+        """returns the (row, dict) of what create() would set on top of
+        the fields of each row, in the order of the row
+
+        Keys that are not attributes are kept as they are. A row that
+        names an attribute that is not a field (width for a Square) is
+        replayed key by key like update() does, and those values are
+        checked into errors when it is given.
+
+        args:
+            rows: list of dicts
+            errors: list where (row, message) pairs are appended
+        """
+        fields = set(cls.fields)
+        plan = cls.plan
+        extras = []
+        for row, d in enumerate(rows):
+            keys = d.keys() - fields
+            if not keys:
+                continue
+            aliased = keys & plan.keys()
+            extras.append((row, {key: value for key, value in d.items()
+                                 if key in keys or
+                                 aliased and key in plan}))
+            if errors is not None:
+                for key in aliased:
+                    _, minimum, label = plan[key]
+                    found = []
+                    cls.column_validator(label, [d[key]], minimum, found)
+                    errors.extend((row, msg) for _, msg in found)
+        return extras
+
     @staticmethod
     def to_json_string(list_dictionaries):
         """ Returns the JSON string representation of list_dict"""
         return json.dumps(list_dictionaries or [])
 
     @classmethod
-    def save_to_file(cls, list_objs):
-        """writes JSON string to a file"""
+    def save_to_file(cls, list_objs, fsync=False, later=False):
+        """writes JSON string to a file
+
+        The file is replaced atomically, see models.persistence.
+
+        args:
+            fsync: wait until the file is on disk
+            later: only encode now and leave the write to the shared
+                write-behind queue, which coalesces successive saves;
+                Base.flush() writes it right away
+        """
         if list_objs:
             j = cls.to_json_string([obj.to_dictionary() for obj in list_objs])
         else:
             j = '[]'
-        with open(cls.__name__ + '.json', 'w') as f:
-            f.write(j)
+        if later:
+            write_behind.submit(cls.__name__ + '.json', j)
+        else:
+            atomic_write(cls.__name__ + '.json', j, fsync)
+
+    @staticmethod
+    def flush():
+        """writes the saves left to the write-behind queue now"""
+        write_behind.flush()
 
     @staticmethod
     def from_json_string(json_string):
@@ -58,20 +368,207 @@ class Base:
     @classmethod
     def create(cls, **dictionary):
         """return instance with all attributes set"""
+        id = dictionary.get('id')
         if cls.__name__ == "Rectangle":
-            dummy = cls(1, 1)
+            dummy = cls(1, 1, id=id)
         if cls.__name__ == "Square":
-            dummy = cls(1)
+            dummy = cls(1, id=id)
         dummy.update(**dictionary)
         return dummy
 
     @classmethod
-    def load_from_file(cls):
-        """Return7s a list of instances"""
+    def load_from_file(cls, trusted=False):
+        """Return7s a list of instances
+
+        args:
+            trusted: build the instances without validating them again
+        """
         try:
             filename = cls.__name__ + '.json'
             with open(filename, mode='r') as f:
                 d = cls.from_json_string(f.read())
+            if trusted:
+                return cls.create_many(d, trusted=True)
             return [cls.create(**x) for x in d]
         except FileNotFoundError:
             return []
+
+    @classmethod
+    def save_to_file_stream(cls, list_objs):
+        """writes one JSON object per line to a file
+
+        args:
+            list_objs: any iterable of instances, including a generator
+        return:
+            number of instances written
+        """
+        count = 0
+        with atomic_open(cls.__name__ + '.jsonl', 'w') as f:
+            for obj in list_objs or []:
+                f.write(json.dumps(obj.to_dictionary()))
+                f.write('\n')
+                count += 1
+        return count
+
+    @classmethod
+    def load_from_file_stream(cls):
+        """yields instances one at a time from a JSON Lines file"""
+        try:
+            f = open(cls.__name__ + '.jsonl', mode='r')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if line.strip():
+                    yield cls.create(**json.loads(line))
+
+    @classmethod
+    def shard_filename(cls, index):
+        """returns the name of shard number index"""
+        return '{}-{}.json'.format(cls.__name__, index)
+
+    @classmethod
+    def save_to_file_sharded(cls, list_objs, shards=None):
+        """writes instances to shard files encoded in parallel
+
+        The collection is split in order into shards files named
+        <Class>-0.json, <Class>-1.json, ... and each one is encoded and
+        written by a worker process, which only receives the values of
+        each instance as a tuple. A shard holds at least SHARD_MIN_SIZE
+        instances, so a small collection is written to <Class>-0.json
+        without starting any process. Shards left by a previous, larger
+        save are removed.
+
+        args:
+            list_objs: list of instances
+            shards: largest number of shard files, os.cpu_count() by
+                default
+        """
+        list_objs = list_objs or []
+        shards = shards or os.cpu_count() or 1
+        shards = max(1, min(shards, -(-len(list_objs) // SHARD_MIN_SIZE)))
+        first = type(list_objs[0]) if list_objs else None
+        if shards > 1 and all(type(obj) is first for obj in list_objs):
+            keys = tuple(list_objs[0].to_dictionary())
+            rows = list(map(attrgetter(*keys), list_objs))
+        else:
+            keys = None
+            rows = [obj.to_dictionary() for obj in list_objs]
+        size = -(-len(rows) // shards)
+        chunks = [rows[i * size:(i + 1) * size] for i in range(shards)]
+        names = [cls.shard_filename(i) for i in range(shards)]
+        if shards == 1:
+            write_json_shard(names[0], keys, chunks[0])
+        else:
+            with ProcessPoolExecutor(shards) as executor:
+                list(executor.map(write_json_shard, names,
+                                  [keys] * shards, chunks))
+        i = shards
+        while os.path.exists(cls.shard_filename(i)):
+            os.remove(cls.shard_filename(i))
+            i += 1
+
+    @classmethod
+    def load_from_file_sharded(cls, trusted=False):
+        """returns the instances of every shard
+
+        Each shard is decoded, turned into columns and validated by a
+        worker process. The instances are then built from the columns
+        with create_from_columns, in this process since that is where
+        their ids are registered.
+        """
+        names = []
+        while os.path.exists(cls.shard_filename(len(names))):
+            names.append(cls.shard_filename(len(names)))
+        if not names:
+            return []
+        if len(names) == 1:
+            parts = [read_json_shard(cls, names[0], trusted)]
+        else:
+            with ProcessPoolExecutor(len(names)) as executor:
+                parts = list(executor.map(read_json_shard,
+                                          [cls] * len(names), names,
+                                          [trusted] * len(names)))
+        columns = {name: [] for name in cls.fields}
+        errors = []
+        extras = []
+        for part_columns, part_errors, part_extras in parts:
+            offset = len(columns['id'])
+            errors.extend((offset + row, msg) for row, msg in part_errors)
+            extras.extend((offset + row, d) for row, d in part_extras)
+            for name in cls.fields:
+                columns[name].extend(part_columns[name])
+        if errors:
+            raise cls.invalid_rows(errors)
+        objs = cls.create_from_columns(columns, trusted=True)
+        for row, d in extras:
+            for key, value in d.items():
+                setattr(objs[row], key, value)
+        return objs
+
+    @classmethod
+    def save_to_file_csv(cls, list_objs):
+        """writes instances to <Class>.csv, one row per instance
+
+        Rows follow cls.fields: id,width,height,x,y for Rectangle and
+        id,size,x,y for Square.
+        """
+        with atomic_open(cls.__name__ + '.csv', 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerows([getattr(obj, name) for name in cls.fields]
+                             for obj in list_objs or [])
+
+    @classmethod
+    def load_from_file_csv(cls, chunk_size=10000, trusted=False):
+        """returns the list of instances stored in <Class>.csv, see
+        iter_from_file_csv
+        """
+        return list(cls.iter_from_file_csv(chunk_size, trusted))
+
+    @classmethod
+    def iter_from_file_csv(cls, chunk_size=10000, trusted=False):
+        """yields the instances stored in <Class>.csv
+
+        The file is read chunk_size rows at a time and each chunk is
+        turned into int columns and built with create_from_columns, so
+        only one chunk is held at a time.
+
+        raises:
+            ValueError: listing every invalid row of the first chunk
+                holding one, counted from the first row of the file
+        """
+        try:
+            f = open(cls.__name__ + '.csv', newline='')
+        except FileNotFoundError:
+            return
+        size = len(cls.fields)
+        filler = [str(cls.plan[name][1]) if name in cls.plan else '0'
+                  for name in cls.fields]
+        start = 0
+        with f:
+            reader = csv.reader(f)
+            while True:
+                chunk = [row for row in islice(reader, chunk_size) if row]
+                if not chunk:
+                    return
+                errors = []
+                if set(map(len, chunk)) != {size}:
+                    for row, values in enumerate(chunk):
+                        if len(values) != size:
+                            errors.append((row, 'expected {} values, got {}'
+                                           .format(size, len(values))))
+                            chunk[row] = filler
+                columns = {}
+                for name, column in zip(cls.fields, zip(*chunk)):
+                    try:
+                        columns[name] = list(map(int, column))
+                    except ValueError:
+                        columns[name] = [_to_int(value) for value in column]
+                if not trusted:
+                    errors.extend(cls.column_errors(columns))
+                if errors:
+                    errors.sort(key=lambda e: e[0])
+                    raise cls.invalid_rows([(start + row, msg)
+                                            for row, msg in errors])
+                start += len(chunk)
+                yield from cls.create_from_columns(columns, trusted=True)
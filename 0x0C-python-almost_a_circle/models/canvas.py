@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Class Canvas Module
+"""
+
+import sys
+
+
+class Canvas:
+    """ draws many shapes into one frame and writes it in one call
+
+    Shapes are drawn the way Rectangle.display draws a single one: x
+    spaces then width '#' on each of height rows, after y empty rows.
+    """
+
+    def __init__(self, shapes=None, char='#'):
+        """instance initialization method
+
+        args:
+            shapes: optional iterable of shapes to draw
+            char: character used to fill the shapes
+        """
+        self.char = char
+        self.shapes = list(shapes or [])
+        self.__last = None
+
+    def add(self, shape):
+        """adds a shape to the canvas"""
+        self.shapes.append(shape)
+
+    def remove(self, shape):
+        """removes a shape from the canvas"""
+        self.shapes.remove(shape)
+
+    def rows(self):
+        """returns the frame as a list of lines without newlines"""
+        if not self.shapes:
+            return []
+        height = max(s.y + s.height for s in self.shapes)
+        width = max(s.x + s.width for s in self.shapes)
+        blank = ' ' * width
+        frame = [None] * height
+        for s in self.shapes:
+            fill = self.char * s.width
+            for i in range(s.y, s.y + s.height):
+                line = frame[i] or blank
+                frame[i] = line[:s.x] + fill + line[s.x + s.width:]
+        return [(line or '').rstrip() for line in frame]
+
+    def render(self):
+        """returns the whole frame as one string"""
+        rows = self.rows()
+        return '\n'.join(rows) + '\n' if rows else ''
+
+    def write(self, file=None):
+        """writes the whole frame to file (stdout by default)"""
+        (file or sys.stdout).write(self.render())
+
+    def refresh(self, file=None):
+        """writes only the rows that changed since the last refresh
+
+        Rows are addressed with ANSI cursor moves, so file should be a
+        terminal; the first call draws the full frame.
+        """
+        rows = self.rows()
+        last = self.__last
+        if last is None:
+            out = ['\x1b[H\x1b[2J']
+            last = []
+        else:
+            out = []
+        for i, line in enumerate(rows):
+            if i >= len(last) or last[i] != line:
+                out.append('\x1b[{};1H{}\x1b[K'.format(i + 1, line))
+        for i in range(len(rows), len(last)):
+            out.append('\x1b[{};1H\x1b[K'.format(i + 1))
+        out.append('\x1b[{};1H'.format(len(rows) + 1))
+        (file or sys.stdout).write(''.join(out))
+        self.__last = rows
@@ -0,0 +1,170 @@
+#!/usr/bin/python3
+"""
+Class IdAllocator Module
+"""
+
+import threading
+from weakref import ref
+
+
+class IdAllocator:
+    """ hands out unique ids to Base instances
+
+    Each thread reserves a block of ids under a lock and then allocates
+    from it without locking, so concurrent producers only meet once per
+    block. An id set explicitly (for example loaded from a file) is
+    remembered while allocate() could still hand it out, so it never
+    is. Once track() is called every new instance is also registered
+    for lookup by id.
+    """
+
+    def __init__(self, block_size=64):
+        """instance initialization method
+
+        args:
+            block_size: number of ids a thread reserves at a time
+        """
+        self.block_size = block_size
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__next = 1
+        self.__index = 0
+        self.__count = 1
+        self.__low = 1
+        self.__top = 1
+        self.__taken = set()
+        self.__blocks = {}
+        self.__registry = None
+        self.__sweep_at = 1024
+
+    def partition(self, index, count):
+        """restricts this allocator to ids where (id - 1) % count == index
+
+        Call it once in each worker process (e.g. from a pool initializer)
+        with a distinct index so processes never allocate the same id.
+        Allocation goes on after the ids already reserved, so it never
+        hands out one of them again, in this process or in the one it
+        was forked from. Ids set explicitly under an earlier partition
+        are only remembered if they were in the share of this process.
+        """
+        if not 0 <= index < count:
+            raise ValueError('index must be >= 0 and < count')
+        with self.__lock:
+            high = (self.__next - 2) * self.__count + self.__index + 1
+            self.__index = index
+            self.__count = count
+            self.__next = max(1, (high - index - 1) // count + 2)
+            self.__local = threading.local()
+            self.__blocks = {}
+            self.__update_low()
+
+    def __update_low(self):
+        """works out the first id past the reserved ones and the
+        smallest id allocate() could still hand out, lock held
+        """
+        self.__top = (self.__next - 1) * self.__count + self.__index + 1
+        low = self.__top
+        for block in self.__blocks.values():
+            low = min(low, block[0])
+        self.__low = low
+
+    def __reserve(self):
+        """reserves the next block of sequence numbers for this thread"""
+        ident = threading.get_ident()
+        with self.__lock:
+            start = self.__next
+            self.__next += self.block_size
+            index, count = self.__index, self.__count
+            block = range((start - 1) * count + index + 1,
+                          (start - 1 + self.block_size) * count + index + 1,
+                          count)
+            old = self.__blocks.pop(ident, None)
+            if old is not None:
+                self.__taken.difference_update(old)
+            if len(self.__blocks) >= threading.active_count():
+                live = {thread.ident for thread in threading.enumerate()}
+                for dead in self.__blocks.keys() - live:
+                    self.__taken.difference_update(self.__blocks.pop(dead))
+            self.__blocks[ident] = block
+            self.__update_low()
+            self.__local.ids = iter(block)
+
+    def allocate(self):
+        """returns a new id never used by this allocator"""
+        while True:
+            ids = getattr(self.__local, 'ids', None)
+            if ids is not None:
+                for i in ids:
+                    if i not in self.__taken:
+                        return i
+                    self.__taken.discard(i)
+            self.__reserve()
+
+    def register(self, obj, id, explicit=True):
+        """records that obj now owns id
+
+        Only an explicit id that allocate() could still hand out is
+        remembered: one past the reserved ids, or one in a block that
+        is not used up yet. Only the second kind takes the lock, to look
+        through the blocks; an id below every block cannot collide and
+        is not remembered at all.
+
+        args:
+            explicit: True when id was not handed out by allocate()
+        """
+        if explicit and type(id) is int and id >= self.__low and \
+                (id - 1) % self.__count == self.__index:
+            if id >= self.__top:
+                # set.add is atomic, and a block reserved meanwhile only
+                # leaves id remembered for longer than needed
+                self.__taken.add(id)
+            else:
+                with self.__lock:
+                    for block in self.__blocks.values():
+                        if id in block:
+                            self.__taken.add(id)
+                            break
+        registry = self.__registry
+        if registry is None:
+            return
+        try:
+            registry[id] = ref(obj)
+        except TypeError:  # id is not hashable, it cannot be looked up
+            return
+        if len(registry) > self.__sweep_at:
+            self.__sweep()
+
+    def track(self, enabled=True):
+        """starts (or stops) registering instances for lookup()
+
+        Registering costs a weak reference per instance, so it is off
+        until something needs to look instances up.
+        """
+        with self.__lock:
+            if not enabled:
+                self.__registry = None
+            elif self.__registry is None:
+                self.__registry = {}
+
+    def __sweep(self):
+        """drops the registry entries of instances that are gone"""
+        registry = self.__registry
+        for id, obj_ref in list(registry.items()):
+            if obj_ref() is None and registry.get(id) is obj_ref:
+                registry.pop(id, None)
+        self.__sweep_at = max(1024, 2 * len(registry))
+
+    def lookup(self, id):
+        """returns the live instance owning id, or None (always None
+        when track() was not called)
+        """
+        if self.__registry is None:
+            return None
+        try:
+            obj_ref = self.__registry.get(id)
+        except TypeError:
+            return None
+        obj = obj_ref() if obj_ref is not None else None
+        if obj is not None and obj.id == id:
+            return obj
+        return None
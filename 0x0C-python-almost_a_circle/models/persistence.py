@@ -0,0 +1,206 @@
+#!/usr/bin/python3
+"""
+Persistence Module
+"""
+
+import atexit
+import logging
+import os
+import secrets
+import threading
+from contextlib import contextmanager
+
+MAX_RETRY_DELAY = 5.0
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindError(Exception):
+    """ raised by WriteBehind.flush when files could not be written
+
+    errors holds the (filename, exception) of every failed write.
+    """
+
+    def __init__(self, errors):
+        """instance initialization method"""
+        super().__init__('could not write ' +
+                         ', '.join(name for name, _ in errors))
+        self.errors = errors
+
+
+def _create_temp(filename):
+    """creates an empty, unique temporary file next to filename
+
+    The file is created with mode 0o666 like open(filename, 'w') does,
+    so the umask of the process applies to it.
+
+    return:
+        (file descriptor, path)
+    """
+    directory, name = os.path.split(os.path.abspath(filename))
+    while True:
+        tmp = os.path.join(directory, '.{}.{}.tmp'.format(
+            name, secrets.token_hex(4)))
+        try:
+            return os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                           0o666), tmp
+        except FileExistsError:
+            continue
+
+
+@contextmanager
+def atomic_open(filename, mode='w', fsync=False, **kwargs):
+    """opens a temporary file that replaces filename once it is closed
+
+    The temporary file lives in the same directory as filename and is
+    renamed over it with os.replace, so readers see either the old or
+    the new content, never a truncated file. If the block raises, the
+    temporary file is removed and filename is left untouched.
+
+    args:
+        filename: file to write
+        mode: 'w', 'wb', ... passed to open with kwargs
+        fsync: flush the file and its directory to disk before returning
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp = _create_temp(filename)
+    try:
+        try:
+            os.chmod(tmp, os.stat(filename).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        with open(fd, mode, **kwargs) as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, filename)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def atomic_write(filename, text, fsync=False):
+    """replaces the content of filename with text, see atomic_open"""
+    with atomic_open(filename, 'w', fsync) as f:
+        f.write(text)
+
+
+class WriteBehind:
+    """ coalesces saves into background writes
+
+    submit only records the latest text of a file and returns. The first
+    submit starts a timer, and when it fires every recorded file is
+    written once with atomic_write, whatever the number of submits in
+    between. A file that could not be written is retried by the timer,
+    waiting twice as long after each failed run, up to MAX_RETRY_DELAY.
+    flush writes the pending files right away; it also runs at exit so
+    nothing submitted is lost.
+    """
+
+    def __init__(self, delay=0.05, fsync=False):
+        """instance initialization method
+
+        args:
+            delay: seconds between the first submit and the write
+            fsync: passed to atomic_write
+        """
+        self.delay = delay
+        self.fsync = fsync
+        self.__lock = threading.Lock()
+        self.__write_lock = threading.Lock()
+        self.__pending = {}
+        self.__timer = None
+        self.__retry_delay = delay
+        self.__errors = {}
+        atexit.register(self.__flush_at_exit)
+
+    def __schedule(self, delay):
+        """starts the timer of the next write, lock held"""
+        if self.__timer is None:
+            self.__timer = threading.Timer(delay, self.__run)
+            self.__timer.daemon = True
+            self.__timer.start()
+
+    def submit(self, filename, text):
+        """schedules filename to be replaced by text"""
+        with self.__lock:
+            self.__pending[filename] = text
+            self.__schedule(self.delay)
+
+    def __write(self):
+        """writes every pending file
+
+        A file that could not be written stays pending, unless a newer
+        text was submitted for it meanwhile, and a retry is scheduled.
+
+        return:
+            dict of the exception of every failed write, by filename
+        """
+        with self.__write_lock:
+            with self.__lock:
+                pending, self.__pending = self.__pending, {}
+                if self.__timer is not None:
+                    self.__timer.cancel()
+                    self.__timer = None
+            errors = {}
+            for filename, text in pending.items():
+                try:
+                    atomic_write(filename, text, self.fsync)
+                except Exception as e:
+                    errors[filename] = e
+            with self.__lock:
+                for filename in pending:
+                    if filename in errors:
+                        self.__pending.setdefault(filename,
+                                                  pending[filename])
+                    else:
+                        self.__errors.pop(filename, None)
+                if errors:
+                    self.__retry_delay = min(2 * self.__retry_delay,
+                                             MAX_RETRY_DELAY)
+                    self.__schedule(self.__retry_delay)
+                else:
+                    self.__retry_delay = self.delay
+        return errors
+
+    def __run(self):
+        """timer callback, keeps the errors for the next flush"""
+        errors = self.__write()
+        with self.__lock:
+            self.__errors.update(errors)
+
+    def flush(self):
+        """writes every pending file now
+
+        Writes are done one flush at a time, so a newer text of a file is
+        never overwritten by an older one. The last error of every file
+        that could not be written, by this flush or in the background
+        since the previous one, is raised here in a single
+        WriteBehindError.
+        """
+        errors = self.__write()
+        with self.__lock:
+            reported, self.__errors = self.__errors, {}
+        reported.update(errors)
+        if reported:
+            raise WriteBehindError(list(reported.items()))
+
+    def __flush_at_exit(self):
+        """flush run at exit, which logs the errors instead of raising"""
+        try:
+            self.flush()
+        except WriteBehindError as e:
+            for filename, error in e.errors:
+                logger.error('could not write %s: %s', filename, error)
+
+
+write_behind = WriteBehind()
@@ -3,12 +3,14 @@
 Class REctangle
 """
 
-
+import sys
 from models.base import Base
 
 
 class Rectangle(Base):
     """ clase Rectangle """
+    fields = ('id', 'width', 'height', 'x', 'y')
+    constraints = (('width', 1), ('height', 1), ('x', 0), ('y', 0))
 
     def __init__(self, width, height, x=0, y=0, id=None):
         """instance initialization method
@@ -28,7 +30,7 @@ class Rectangle(Base):
     def update(self, *args, **kwargs):
         """ update attributes """
         if args:
-            listme = ['id', 'width', 'height', 'x', 'y']
+            listme = self.fields
             i = 0
             for arg in args:
                 setattr(self, listme[i], arg)
@@ -47,59 +49,22 @@ class Rectangle(Base):
         """ computes area of the rectangle """
         return self.width * self.height
 
-    def display(self):
-        """ prints the rectangle """
-        for y in range(self.y):
-            print()
-        for col in range(self.height):
-            print(" " * self.x + "#" * self.width)
-
-    def __str__(self):
-        """print method"""
-        return "[{}] ({}) {}/{} - {}/{}".format(self.__class__.__name__,
-                                                self.id, self.__x, self.__y,
-                                                self.__width, self.__height)
-
-    @property
-    def width(self):
-        """width getter methond"""
-        return self.__width
-
-    @width.setter
-    def width(self, value):
-        """width setter method"""
-        self.integer_validator('width', value)
-        self.__width = value
-
-    @property
-    def height(self):
-        """height setter method"""
-        return self.__height
-
-    @height.setter
-    def height(self, value):
-        """height setter method"""
-        self.integer_validator('highet', value)
-        self.__height = value
-
-    @property
-    def x(self):
-        """x getter method"""
-        return self.__x
+    def display(self, file=None):
+        """ prints the rectangle with a single write
 
-    @x.setter
-    def x(self, value):
-        """x setter method"""
-        self.integer_validator2('x', value)
-        self.__x = value
+        args:
+            file: file-like object to write to, stdout by default
+        """
+        row = " " * self.x + "#" * self.width + "\n"
+        (file or sys.stdout).write("\n" * self.y + row * self.height)
 
     @property
-    def y(self):
-        """y getter method"""
-        return self.__y
+    def shape_name(self):
+        """name shown by __str__, the name of the class"""
+        return self.__class__.__name__
 
-    @y.setter
-    def y(self, value):
-        """y setter method"""
-        self.integer_validator2('y', value)
-        self.__y = value
+    def __str__(self):
+        """print method"""
+        return "[{}] ({}) {}/{} - {}/{}".format(self.shape_name, self.id,
+                                                self.x, self.y,
+                                                self.width, self.height)
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+"""
+Binary shape file Module
+
+A shape file is a fixed header followed by fixed-width records:
+
+    header: magic b'SHAP', version, reserved, record count
+    record: type tag, padding, id, width, height, x, y (int64)
+
+Records are read straight out of an mmap, so opening a file costs the
+same whatever its size and only the records that are indexed get
+turned into Rectangle/Square instances.
+"""
+
+import mmap
+import os
+import struct
+from itertools import chain
+from models.rectangle import Rectangle
+from models.square import Square
+from models.persistence import atomic_open
+from models.shape_store import SquareView
+
+MAGIC = b'SHAP'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQ')
+RECORD = struct.Struct('<B7xqqqqq')
+TAGS = {Rectangle: 0, Square: 1}
+CLASSES = {0: Rectangle, 1: Square}
+
+
+def tag(obj):
+    """returns the type tag of a shape, subclasses and ShapeStore
+    views included
+    """
+    return TAGS[Square if isinstance(obj, (Square, SquareView))
+                else Rectangle]
+
+
+def save_to_file(list_objs, filename=None):
+    """writes Rectangle/Square instances to a binary shape file
+
+    The records are written as they come and the header is filled in
+    at the end, through persistence.atomic_open, so the file is replaced
+    only once every record is written.
+
+    args:
+        list_objs: iterable of instances or ShapeStore views (may mix
+            both classes)
+        filename: defaults to <Class>.bin of the class of the first
+            instance, Rectangle or Square
+    return:
+        number of records written
+    """
+    objs = iter(list_objs or [])
+    first = next(objs, None)
+    if first is not None:
+        objs = chain((first,), objs)
+    if filename is None:
+        cls = CLASSES[tag(first)] if first is not None else Rectangle
+        filename = cls.__name__ + '.bin'
+    pack = RECORD.pack
+    with atomic_open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        count = 0
+        for obj in objs:
+            f.write(pack(tag(obj), obj.id, obj.width, obj.height,
+                         obj.x, obj.y))
+            count += 1
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, count))
+    return count
+
+
+class ShapeFile:
+    """ read-only, memory-mapped view of a binary shape file """
+
+    def __init__(self, filename):
+        """maps filename and checks its header"""
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError('{} is not a shape file'.format(filename))
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count = HEADER.unpack_from(self.__map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError('{} is not a shape file'.format(filename))
+        if version != VERSION:
+            self.close()
+            raise ValueError('unsupported shape file version {}'.format(
+                version))
+        if len(self.__map) < HEADER.size + count * RECORD.size:
+            self.close()
+            raise ValueError('{} is truncated'.format(filename))
+        self.__count = count
+
+    def __len__(self):
+        """number of records in the file"""
+        return self.__count
+
+    def record(self, i):
+        """returns the raw (tag, id, width, height, x, y) tuple of row i"""
+        if i < 0:
+            i += self.__count
+        if not 0 <= i < self.__count:
+            raise IndexError('ShapeFile index out of range')
+        return RECORD.unpack_from(self.__map, HEADER.size + i * RECORD.size)
+
+    def __getitem__(self, i):
+        """returns a new Rectangle/Square built from record i"""
+        tag, id, width, height, x, y = self.record(i)
+        if CLASSES[tag] is Square:
+            return Square(width, x, y, id)
+        return Rectangle(width, height, x, y, id)
+
+    def __iter__(self):
+        """yields every record as an instance"""
+        for i in range(self.__count):
+            yield self[i]
+
+    def close(self):
+        """unmaps the file"""
+        self.__map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_from_file(filename):
+    """returns the list of instances stored in a binary shape file"""
+    with ShapeFile(filename) as shapes:
+        return list(shapes)
+
+
+def json_to_binary(cls):
+    """converts <Class>.json into <Class>.bin"""
+    return save_to_file(cls.load_from_file(), cls.__name__ + '.bin')
+
+
+def binary_to_json(cls):
+    """converts <Class>.bin into <Class>.json"""
+    cls.save_to_file(load_from_file(cls.__name__ + '.bin'))
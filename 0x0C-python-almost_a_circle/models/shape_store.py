@@ -0,0 +1,197 @@
+#!/usr/bin/python3
+"""
+Class ShapeStore Module
+"""
+
+from array import array
+from itertools import compress
+from operator import mul
+from models.base import Base
+from models.rectangle import Rectangle
+from models.square import Square
+
+RECTANGLE = 0
+SQUARE = 1
+
+
+class RectangleView:
+    """ lightweight Rectangle backed by a row of a ShapeStore
+
+    update, to_dictionary, area, display and __str__ are the ones of
+    Rectangle, and width, height, x and y are checked by the plan of
+    Rectangle, see view_property.
+    """
+    __slots__ = ('_store', '_i')
+    shape_name = 'Rectangle'
+    fields = Rectangle.fields
+
+    def __init__(self, store, i):
+        """instance initialization method
+
+        args:
+            store: the ShapeStore holding the data
+            i: row index inside the store
+        """
+        self._store = store
+        self._i = i
+
+    update = Rectangle.update
+    to_dictionary = Rectangle.to_dictionary
+    area = Rectangle.area
+    display = Rectangle.display
+    __str__ = Rectangle.__str__
+
+    @property
+    def id(self):
+        """id getter method"""
+        return self._store.ids[self._i]
+
+    @id.setter
+    def id(self, value):
+        """id setter method"""
+        self._store.ids[self._i] = value
+
+
+class SquareView(RectangleView):
+    """ lightweight Square backed by a row of a ShapeStore """
+    __slots__ = ()
+    shape_name = 'Square'
+    fields = Square.fields
+
+    to_dictionary = Square.to_dictionary
+    __str__ = Square.__str__
+
+
+COLUMNS = {Rectangle.plan[name][0][0]: name + 's' for name in Rectangle.plan}
+
+
+def view_property(storage, minimum, label):
+    """returns a property of a view for a plan entry, checking the value
+    like Base.compile_property does and storing it in the store columns
+    of the attributes of storage
+
+    args:
+        storage: names of the Rectangle attributes holding the value
+        minimum: smallest accepted value
+        label: attribute name used in the error messages
+    """
+    type_msg, value_msg = Base.plan_messages(minimum, label)
+    columns = [COLUMNS[attr] for attr in storage]
+    first = columns[0]
+
+    def getter(self):
+        """reads the value from the store"""
+        return getattr(self._store, first)[self._i]
+
+    def setter(self, value):
+        """validates value and stores it in the store"""
+        if type(value) is not int:
+            raise TypeError(type_msg)
+        if value < minimum:
+            raise ValueError(value_msg)
+        for column in columns:
+            getattr(self._store, column)[self._i] = value
+    return property(getter, setter,
+                    doc='{} (int >= {})'.format(label, minimum))
+
+
+for name, entry in Square.plan.items():
+    setattr(RectangleView if name in Rectangle.plan else SquareView, name,
+            view_property(*entry))
+
+
+class ShapeStore:
+    """ column store for large collections of Rectangle and Square
+
+    Every attribute lives in its own typed array, one row per shape,
+    so a shape costs a few machine words instead of a full object.
+    """
+
+    def __init__(self, shapes=None):
+        """instance initialization method
+
+        args:
+            shapes: optional iterable of Rectangle/Square to load
+        """
+        self.kinds = array('b')
+        self.ids = array('q')
+        self.widths = array('q')
+        self.heights = array('q')
+        self.xs = array('q')
+        self.ys = array('q')
+        if shapes:
+            self.extend(shapes)
+
+    def __len__(self):
+        """number of shapes in the store"""
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        """returns a view on the shape stored at row i"""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('ShapeStore index out of range')
+        if self.kinds[i] == SQUARE:
+            return SquareView(self, i)
+        return RectangleView(self, i)
+
+    def __iter__(self):
+        """iterates over views of every stored shape"""
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, shape):
+        """copies a Rectangle, Square or view into the store
+
+        return:
+            row index of the new shape
+        """
+        kind = SQUARE if isinstance(shape, (Square, SquareView)) \
+            else RECTANGLE
+        self.kinds.append(kind)
+        self.ids.append(shape.id)
+        self.widths.append(shape.width)
+        self.heights.append(shape.height)
+        self.xs.append(shape.x)
+        self.ys.append(shape.y)
+        return len(self) - 1
+
+    def extend(self, shapes):
+        """copies every shape of an iterable into the store"""
+        for shape in shapes:
+            self.append(shape)
+
+    def area(self):
+        """returns the areas of every shape as an array"""
+        return array('q', map(mul, self.widths, self.heights))
+
+    def filter(self, predicate):
+        """returns a new store with the rows matching predicate
+
+        args:
+            predicate: called as predicate(id, width, height, x, y)
+        """
+        mask = list(map(predicate, self.ids, self.widths, self.heights,
+                        self.xs, self.ys))
+        new = ShapeStore()
+        for name in ('kinds', 'ids', 'widths', 'heights', 'xs', 'ys'):
+            column = getattr(self, name)
+            setattr(new, name,
+                    array(column.typecode, compress(column, mask)))
+        return new
+
+    def to_dictionary(self):
+        """return list of dict representations of every shape"""
+        return [view.to_dictionary() for view in self]
+
+    def to_shapes(self):
+        """return real Rectangle/Square instances for every row"""
+        shapes = []
+        for kind, id, w, h, x, y in zip(self.kinds, self.ids, self.widths,
+                                        self.heights, self.xs, self.ys):
+            if kind == SQUARE:
+                shapes.append(Square(w, x, y, id))
+            else:
+                shapes.append(Rectangle(w, h, x, y, id))
+        return shapes
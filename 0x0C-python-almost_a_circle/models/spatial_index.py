@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+"""
+Class GridIndex Module
+"""
+
+from heapq import nsmallest
+
+
+class GridIndex:
+    """ uniform grid index over Rectangle/Square positions
+
+    The plane is cut into square cells of cell_size units and every
+    shape is registered in each cell its area touches, so point and
+    window queries only look at the shapes of the cells they cover.
+    A shape covers [x, x + width) x [y, y + height).
+    """
+
+    def __init__(self, cell_size=16):
+        """instance initialization method
+
+        args:
+            cell_size: side of a grid cell, in the shapes' units
+        """
+        if type(cell_size) is not int:
+            raise TypeError('cell_size must be an integer')
+        if cell_size <= 0:
+            raise ValueError('cell_size must be > 0')
+        self.cell_size = cell_size
+        self.__cells = {}
+        self.__shapes = {}
+        self.__extent = None
+
+    def __len__(self):
+        """number of indexed shapes"""
+        return len(self.__shapes)
+
+    def __contains__(self, shape):
+        """checks if shape is indexed"""
+        return id(shape) in self.__shapes
+
+    def __span(self, x0, y0, x1, y1):
+        """returns the cell keys covering [x0, x1) x [y0, y1)"""
+        c = self.cell_size
+        return [(cx, cy)
+                for cx in range(x0 // c, (x1 - 1) // c + 1)
+                for cy in range(y0 // c, (y1 - 1) // c + 1)]
+
+    def insert(self, shape):
+        """adds shape to the index"""
+        if id(shape) in self.__shapes:
+            raise ValueError('shape already indexed')
+        bounds = (shape.x, shape.y, shape.x + shape.width,
+                  shape.y + shape.height)
+        keys = self.__span(*bounds)
+        c = self.cell_size
+        lo_x, lo_y = bounds[0] // c, bounds[1] // c
+        hi_x, hi_y = (bounds[2] - 1) // c, (bounds[3] - 1) // c
+        if self.__extent:
+            ex0, ey0, ex1, ey1 = self.__extent
+            lo_x, lo_y = min(lo_x, ex0), min(lo_y, ey0)
+            hi_x, hi_y = max(hi_x, ex1), max(hi_y, ey1)
+        self.__extent = (lo_x, lo_y, hi_x, hi_y)
+        for key in keys:
+            self.__cells.setdefault(key, {})[id(shape)] = shape
+        self.__shapes[id(shape)] = (shape, bounds, keys)
+
+    def remove(self, shape):
+        """removes shape from the index"""
+        try:
+            _, _, keys = self.__shapes.pop(id(shape))
+        except KeyError:
+            raise ValueError('shape not indexed') from None
+        for key in keys:
+            cell = self.__cells[key]
+            del cell[id(shape)]
+            if not cell:
+                del self.__cells[key]
+
+    def update(self, shape):
+        """re-indexes shape after its position or size changed"""
+        _, bounds, _ = self.__shapes[id(shape)]
+        if bounds != (shape.x, shape.y, shape.x + shape.width,
+                      shape.y + shape.height):
+            self.remove(shape)
+            self.insert(shape)
+
+    def move(self, shape, *args, **kwargs):
+        """calls shape.update(*args, **kwargs) and re-indexes shape"""
+        shape.update(*args, **kwargs)
+        self.update(shape)
+
+    def query_point(self, px, py):
+        """returns the shapes covering the point (px, py)"""
+        c = self.cell_size
+        cell = self.__cells.get((px // c, py // c), {})
+        return [shape for key, shape in cell.items()
+                if self.__covers(self.__shapes[key][1], px, py)]
+
+    @staticmethod
+    def __covers(bounds, px, py):
+        """checks if bounds contain (px, py)"""
+        x0, y0, x1, y1 = bounds
+        return x0 <= px < x1 and y0 <= py < y1
+
+    def query_window(self, x0, y0, x1, y1):
+        """returns the shapes overlapping the window [x0, x1) x [y0, y1)"""
+        if x1 <= x0 or y1 <= y0:
+            return []
+        found = {}
+        for key in self.__span(x0, y0, x1, y1):
+            for sid, shape in self.__cells.get(key, {}).items():
+                if sid not in found:
+                    sx0, sy0, sx1, sy1 = self.__shapes[sid][1]
+                    if sx0 < x1 and x0 < sx1 and sy0 < y1 and y0 < sy1:
+                        found[sid] = shape
+        return list(found.values())
+
+    @staticmethod
+    def __distance2(bounds, px, py):
+        """squared distance from (px, py) to the closest covered point"""
+        x0, y0, x1, y1 = bounds
+        dx = max(x0 - px, 0, px - (x1 - 1))
+        dy = max(y0 - py, 0, py - (y1 - 1))
+        return dx * dx + dy * dy
+
+    def __ring(self, pcx, pcy, r):
+        """returns the cells of the square ring of radius r around the
+        cell (pcx, pcy), clipped to the extent of the index, as
+        (columns of its top/bottom rows, those rows,
+         rows of its left/right columns, those columns)
+        """
+        ex0, ey0, ex1, ey1 = self.__extent
+        xs = range(max(pcx - r, ex0), min(pcx + r, ex1) + 1)
+        rows = [cy for cy in {pcy - r, pcy + r} if ey0 <= cy <= ey1]
+        ys = range(max(pcy - r + 1, ey0), min(pcy + r - 1, ey1) + 1)
+        cols = [cx for cx in {pcx - r, pcx + r} if ex0 <= cx <= ex1]
+        if r == 0:
+            ys = ()
+        return xs, rows, ys, cols
+
+    def __unvisited2(self, px, py, pcx, pcy, r):
+        """squared distance from (px, py) to the cells of the extent
+        outside the square of radius r around (pcx, pcy), None if there
+        are none left
+        """
+        ex0, ey0, ex1, ey1 = self.__extent
+        x0, x1 = max(pcx - r, ex0), min(pcx + r, ex1)
+        strips = ((ex0, ey0, pcx - r - 1, ey1), (pcx + r + 1, ey0, ex1, ey1),
+                  (x0, ey0, x1, pcy - r - 1), (x0, pcy + r + 1, x1, ey1))
+        c = self.cell_size
+        return min((self.__distance2((sx0 * c, sy0 * c, (sx1 + 1) * c,
+                                      (sy1 + 1) * c), px, py)
+                    for sx0, sy0, sx1, sy1 in strips
+                    if sx0 <= sx1 and sy0 <= sy1), default=None)
+
+    def nearest(self, px, py, k=1):
+        """returns the k shapes closest to (px, py), closest first
+
+        Cells are visited in growing square rings around the point's
+        cell, starting with the first ring that reaches the indexed
+        area and clipped to it; the search stops once k shapes are known
+        to be closer than the part of that area not yet visited. When a
+        ring holds more cells than there are shapes, the remaining
+        search is a scan of every shape instead.
+        """
+        if k <= 0 or not self.__shapes:
+            return []
+        c = self.cell_size
+        pcx, pcy = px // c, py // c
+        ex0, ey0, ex1, ey1 = self.__extent
+        r = max(ex0 - pcx, pcx - ex1, ey0 - pcy, pcy - ey1, 0)
+        seen = {}
+        while True:
+            xs, rows, ys, cols = self.__ring(pcx, pcy, r)
+            if len(xs) * len(rows) + len(ys) * len(cols) > len(self.__shapes):
+                seen = {sid: self.__distance2(bounds, px, py)
+                        for sid, (_, bounds, _) in self.__shapes.items()}
+                break
+            ring = [(cx, cy) for cy in rows for cx in xs]
+            ring += [(cx, cy) for cx in cols for cy in ys]
+            for key in ring:
+                for sid in self.__cells.get(key, ()):
+                    if sid not in seen:
+                        seen[sid] = self.__distance2(
+                            self.__shapes[sid][1], px, py)
+            rest = self.__unvisited2(px, py, pcx, pcy, r)
+            if rest is None:
+                break
+            if len(seen) >= k:
+                best = nsmallest(k, seen.values())
+                if best[-1] <= rest:
+                    break
+            r += 1
+        best = nsmallest(k, seen.items(), key=lambda item: item[1])
+        return [self.__shapes[sid][0] for sid, _ in best]
@@ -9,6 +9,8 @@ from models.rectangle import Rectangle
 
 class Square(Rectangle):
     """ Square class """
+    fields = ('id', 'size', 'x', 'y')
+    aliases = {'size': ('width', 'height')}
 
     def __init__(self, size, x=0, y=0, id=None):
         """instance initialization method
@@ -24,42 +26,9 @@ class Square(Rectangle):
     def __str__(self):
         """ print method """
         return ("[{}] ({}) {}/{} - {}".format(
-            self.__class__.__name__, self.id, self.x, self.y, self.width))
+            self.shape_name, self.id, self.x, self.y, self.width))
 
     def to_dictionary(self):
         """returns the dictionary rep """
         return {'id': self.id, 'size': self.size, 'x': self.x,
                 'y': self.y}
-
-    @property
-    def size(self):
-        """width getter method
-        return:
-            size of width and height
-        """
-        return self.width
-
-    @size.setter
-    def size(self, value):
-        """ width and height setter method
-        args:
-            value: size value
-        return:
-            na
-        """
-        self.width = value
-        self.height = value
-
-    def update(self, *args, **kwargs):
-        """update square method"""
-
-        if args:
-            i = 0
-            listme = ['id', 'size', 'x', 'y']
-            for arg in args:
-                setattr(self, listme[i], arg)
-                i += 1
-            return
-        else:
-            for key, value in kwargs.items():
-                setattr(self, key, value)
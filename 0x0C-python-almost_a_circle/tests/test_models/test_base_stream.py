@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""Unittest for the JSON Lines persistence of models/base.py
+"""
+import os
+import tempfile
+import unittest
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestJsonLines(unittest.TestCase):
+    """Tests for save_to_file_stream and load_from_file_stream"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        shapes = [Rectangle(3, 4, 1, 2, 10), Rectangle(5, 6, 0, 0, 11)]
+        self.assertEqual(Rectangle.save_to_file_stream(shapes), 2)
+        loaded = list(Rectangle.load_from_file_stream())
+        self.assertEqual([r.to_dictionary() for r in loaded],
+                         [r.to_dictionary() for r in shapes])
+
+    def test_one_object_per_line(self):
+        Square.save_to_file_stream([Square(2, 1, 1, 5), Square(3)])
+        with open('Square.jsonl') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0], '{"id": 5, "size": 2, "x": 1, "y": 1}')
+
+    def test_generator(self):
+        count = Square.save_to_file_stream(Square(i, id=i)
+                                           for i in range(1, 6))
+        self.assertEqual(count, 5)
+        self.assertEqual([s.size for s in Square.load_from_file_stream()],
+                         [1, 2, 3, 4, 5])
+
+    def test_empty_and_none(self):
+        self.assertEqual(Rectangle.save_to_file_stream(None), 0)
+        self.assertEqual(list(Rectangle.load_from_file_stream()), [])
+        self.assertEqual(Rectangle.save_to_file_stream([]), 0)
+        self.assertEqual(os.path.getsize('Rectangle.jsonl'), 0)
+
+    def test_missing_file(self):
+        self.assertEqual(list(Rectangle.load_from_file_stream()), [])
+
+    def test_blank_lines(self):
+        with open('Rectangle.jsonl', 'w') as f:
+            f.write('{"id": 1, "width": 2, "height": 3, "x": 0, "y": 0}\n'
+                    '\n\n{"id": 2, "width": 4, "height": 5}\n')
+        loaded = list(Rectangle.load_from_file_stream())
+        self.assertEqual([(r.id, r.width, r.height) for r in loaded],
+                         [(1, 2, 3), (2, 4, 5)])
+
+    def test_lazy(self):
+        Rectangle.save_to_file_stream([Rectangle(1, 1, id=1),
+                                       Rectangle(1, 1, id=2)])
+        shapes = Rectangle.load_from_file_stream()
+        self.assertEqual(next(shapes).id, 1)
+        shapes.close()
+
+    def test_invalid_line(self):
+        with open('Rectangle.jsonl', 'w') as f:
+            f.write('{"id": 1, "width": -2, "height": 3}\n')
+        with self.assertRaisesRegex(ValueError, 'width must be > 0'):
+            list(Rectangle.load_from_file_stream())
+
+    def test_failed_save_keeps_file(self):
+        Rectangle.save_to_file_stream([Rectangle(1, 1, id=1)])
+
+        def shapes():
+            yield Rectangle(2, 2, id=2)
+            raise RuntimeError('stop')
+        with self.assertRaises(RuntimeError):
+            Rectangle.save_to_file_stream(shapes())
+        self.assertEqual([r.id for r in Rectangle.load_from_file_stream()],
+                         [1])
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+"""Unittest for models/canvas.py and Rectangle.display
+"""
+import io
+import unittest
+from contextlib import redirect_stdout
+from models.canvas import Canvas
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestDisplay(unittest.TestCase):
+    """Tests for Rectangle.display"""
+
+    def test_display(self):
+        out = io.StringIO()
+        Rectangle(3, 2, 1, 2).display(out)
+        self.assertEqual(out.getvalue(), '\n\n ###\n ###\n')
+
+    def test_stdout(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            Square(2).display()
+        self.assertEqual(out.getvalue(), '##\n##\n')
+
+
+class TestCanvas(unittest.TestCase):
+    """Tests for Canvas"""
+
+    def test_single_shape_like_display(self):
+        for shape in (Rectangle(3, 2, 1, 2), Square(4, 0, 1)):
+            expected = io.StringIO()
+            shape.display(expected)
+            self.assertEqual(Canvas([shape]).render(),
+                             expected.getvalue().replace(' \n', '\n'))
+
+    def test_overlap(self):
+        canvas = Canvas([Rectangle(3, 2), Square(2, 2, 1)], char='*')
+        self.assertEqual(canvas.rows(), ['***', '****', '  **'])
+
+    def test_empty(self):
+        canvas = Canvas()
+        self.assertEqual(canvas.rows(), [])
+        self.assertEqual(canvas.render(), '')
+
+    def test_add_remove(self):
+        square = Square(1, 3, 0)
+        canvas = Canvas([Rectangle(1, 1)])
+        canvas.add(square)
+        self.assertEqual(canvas.render(), '#  #\n')
+        canvas.remove(square)
+        self.assertEqual(canvas.render(), '#\n')
+
+    def test_write(self):
+        out = io.StringIO()
+        Canvas([Rectangle(2, 1, 0, 1)]).write(out)
+        self.assertEqual(out.getvalue(), '\n##\n')
+
+    def test_refresh(self):
+        square = Square(1)
+        canvas = Canvas([square, Rectangle(2, 1, 0, 1)])
+        first = io.StringIO()
+        canvas.refresh(first)
+        self.assertEqual(first.getvalue(),
+                         '\x1b[H\x1b[2J\x1b[1;1H#\x1b[K'
+                         '\x1b[2;1H##\x1b[K\x1b[3;1H')
+        square.x = 1
+        second = io.StringIO()
+        canvas.refresh(second)
+        self.assertEqual(second.getvalue(), '\x1b[1;1H #\x1b[K\x1b[3;1H')
+        canvas.shapes = [square]
+        third = io.StringIO()
+        canvas.refresh(third)
+        self.assertEqual(third.getvalue(), '\x1b[2;1H\x1b[K\x1b[2;1H')
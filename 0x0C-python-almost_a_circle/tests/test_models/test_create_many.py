@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+"""Unittest for create_many and create_from_columns of models/base.py
+"""
+import unittest
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestCreateMany(unittest.TestCase):
+    """Tests for create_many"""
+
+    def check_like_create(self, cls, rows):
+        many = cls.create_many(rows)
+        one = [cls.create(**d) for d in rows]
+        self.assertEqual([type(obj) for obj in many], [cls] * len(rows))
+        self.assertEqual([obj.to_dictionary() for obj in many],
+                         [obj.to_dictionary() for obj in one])
+        return many
+
+    def test_like_create(self):
+        self.check_like_create(Rectangle, [
+            {'id': 1, 'width': 2, 'height': 3, 'x': 4, 'y': 5},
+            {'id': 2, 'width': 6, 'height': 7}])
+        self.check_like_create(Square, [
+            {'id': 3, 'size': 4, 'x': 1, 'y': 2}, {'id': 4, 'size': 1}])
+
+    def test_alias_keys(self):
+        squares = self.check_like_create(Square, [
+            {'id': 5, 'size': 3, 'width': 4},
+            {'id': 6, 'width': 4, 'size': 3}])
+        self.assertEqual([(s.width, s.height) for s in squares],
+                         [(4, 3), (3, 3)])
+
+    def test_extra_keys(self):
+        rect, = Rectangle.create_many([{'id': 7, 'width': 1, 'height': 1,
+                                        'color': 'red'}])
+        self.assertEqual(rect.color, 'red')
+
+    def test_no_id(self):
+        a, b = Rectangle.create_many([{'width': 1, 'height': 1}] * 2)
+        self.assertNotEqual(a.id, b.id)
+
+    def test_empty(self):
+        self.assertEqual(Rectangle.create_many([]), [])
+        self.assertEqual(Square.create_many(iter([])), [])
+
+    def test_errors_by_row(self):
+        rows = [{'id': 1, 'width': 2, 'height': 3},
+                {'id': 2, 'width': 0, 'height': 'a'},
+                {'id': 3, 'width': 1, 'height': 1, 'x': -1}]
+        with self.assertRaises(ValueError) as cm:
+            Rectangle.create_many(rows)
+        self.assertEqual(str(cm.exception),
+                         'invalid rows:\n'
+                         'row 1: width must be > 0\n'
+                         'row 1: height must be an integer\n'
+                         'row 2: x must be >= 0')
+
+    def test_alias_errors(self):
+        with self.assertRaisesRegex(ValueError, 'row 0: height must be an'):
+            Square.create_many([{'id': 1, 'size': 2, 'height': 'a'}])
+
+    def test_trusted(self):
+        rect, = Rectangle.create_many([{'id': 1, 'width': 2, 'height': 3,
+                                        'x': 0, 'y': 0}], trusted=True)
+        self.assertEqual(str(rect), '[Rectangle] (1) 0/0 - 2/3')
+
+    def test_create_from_columns(self):
+        columns = {'id': [1, 2], 'size': [3, 4], 'x': [0, 1], 'y': [0, 2]}
+        squares = Square.create_from_columns(columns)
+        self.assertEqual([str(s) for s in squares],
+                         ['[Square] (1) 0/0 - 3', '[Square] (2) 1/2 - 4'])
+        columns['size'][1] = -4
+        with self.assertRaisesRegex(ValueError, 'row 1: width must be > 0'):
+            Square.create_from_columns(columns)
@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+"""Unittest for the CSV persistence of models/base.py
+"""
+import os
+import tempfile
+import unittest
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestCsv(unittest.TestCase):
+    """Tests for save_to_file_csv, load_from_file_csv and
+    iter_from_file_csv
+    """
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        with open(name, 'w') as f:
+            f.write(text)
+
+    def test_round_trip(self):
+        rects = [Rectangle(3, 4, 1, 2, 7), Rectangle(5, 6, 0, 0, 8)]
+        Rectangle.save_to_file_csv(rects)
+        with open('Rectangle.csv', newline='') as f:
+            self.assertEqual(f.read(), '7,3,4,1,2\r\n8,5,6,0,0\r\n')
+        for chunk_size in (1, 10000):
+            loaded = Rectangle.load_from_file_csv(chunk_size)
+            self.assertEqual([r.to_dictionary() for r in loaded],
+                             [r.to_dictionary() for r in rects])
+
+    def test_squares(self):
+        Square.save_to_file_csv([Square(2, 1, 0, 3), Square(4, id=5)])
+        self.assertEqual([str(s) for s in Square.load_from_file_csv()],
+                         ['[Square] (3) 1/0 - 2', '[Square] (5) 0/0 - 4'])
+
+    def test_empty_and_missing(self):
+        self.assertEqual(Square.load_from_file_csv(), [])
+        Square.save_to_file_csv(None)
+        self.assertEqual(Square.load_from_file_csv(), [])
+
+    def test_blank_lines(self):
+        self.write('Square.csv', '1,2,0,0\n\n2,3,1,1\n')
+        self.assertEqual([s.id for s in Square.load_from_file_csv()], [1, 2])
+
+    def test_iter_is_lazy(self):
+        self.write('Square.csv', '1,2,0,0\n2,3,1,1\n3,x,0,0\n')
+        squares = Square.iter_from_file_csv(chunk_size=2)
+        self.assertEqual([next(squares).id, next(squares).id], [1, 2])
+        with self.assertRaisesRegex(ValueError, 'row 2: width must be an'):
+            next(squares)
+
+    def test_errors_by_row(self):
+        self.write('Rectangle.csv',
+                   '1,2,3,0,0\n2,0,3,0,0\n3,2,3\n4,2,a,0,-1\n')
+        for chunk_size in (2, 10000):
+            with self.assertRaises(ValueError) as cm:
+                Rectangle.load_from_file_csv(chunk_size)
+        self.assertEqual(str(cm.exception),
+                         'invalid rows:\nrow 1: width must be > 0\n'
+                         'row 2: expected 5 values, got 3\n'
+                         'row 3: height must be an integer\n'
+                         'row 3: y must be >= 0')
+
+    def test_errors_of_later_chunk(self):
+        self.write('Square.csv', '1,2,0,0\n2,2,0,0\n3,2,0,0,9\n')
+        with self.assertRaisesRegex(ValueError,
+                                    'row 2: expected 4 values, got 5'):
+            Square.load_from_file_csv(chunk_size=2)
+
+    def test_trusted(self):
+        self.write('Square.csv', '1,2,0,0\n')
+        square, = Square.load_from_file_csv(trusted=True)
+        self.assertEqual((square.width, square.height), (2, 2))
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""Unittest for models/id_allocator.py and the ids of Base
+"""
+import threading
+import unittest
+from models.base import Base
+from models.id_allocator import IdAllocator
+from models.rectangle import Rectangle
+
+
+class Shape:
+    """stand-in for an instance registered with an id"""
+
+    def __init__(self, id):
+        self.id = id
+
+
+class TestIdAllocator(unittest.TestCase):
+    """Tests for IdAllocator"""
+
+    def test_sequence(self):
+        ids = IdAllocator(block_size=4)
+        self.assertEqual([ids.allocate() for _ in range(10)],
+                         list(range(1, 11)))
+
+    def test_explicit_ids_are_skipped(self):
+        ids = IdAllocator(block_size=4)
+        for id in (2, 5, 20):
+            ids.register(Shape(id), id)
+        self.assertEqual([ids.allocate() for _ in range(6)],
+                         [1, 3, 4, 6, 7, 8])
+
+    def test_explicit_id_in_live_block(self):
+        ids = IdAllocator(block_size=8)
+        self.assertEqual(ids.allocate(), 1)
+        ids.register(Shape(3), 3)
+        self.assertEqual([ids.allocate() for _ in range(3)], [2, 4, 5])
+
+    def test_non_int_ids(self):
+        ids = IdAllocator()
+        ids.track()
+        shape = Shape("a")
+        ids.register(shape, "a")
+        ids.register(Shape([1, 2]), [1, 2])
+        self.assertIs(ids.lookup("a"), shape)
+        self.assertIsNone(ids.lookup([1, 2]))
+        self.assertEqual(ids.allocate(), 1)
+
+    def test_threads_get_unique_ids(self):
+        ids = IdAllocator(block_size=16)
+        explicit = set(range(5, 2000, 7))
+        for id in explicit:
+            ids.register(Shape(id), id)
+        results = []
+
+        def worker():
+            results.append([ids.allocate() for _ in range(2000)])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        allocated = [id for ids_ in results for id in ids_]
+        self.assertEqual(len(allocated), len(set(allocated)))
+        self.assertFalse(explicit & set(allocated))
+
+    def test_partition(self):
+        ids = IdAllocator(block_size=4)
+        with self.assertRaises(ValueError):
+            ids.partition(2, 2)
+        ids.partition(1, 3)
+        self.assertEqual([ids.allocate() for _ in range(3)], [2, 5, 8])
+
+    def test_partition_keeps_watermark(self):
+        used = []
+        for index in range(4):
+            ids = IdAllocator(block_size=4)
+            first = [ids.allocate() for _ in range(10)]
+            ids.partition(index, 4)
+            used.extend([ids.allocate() for _ in range(20)])
+        self.assertEqual(len(used), len(set(used)))
+        self.assertGreater(min(used), max(first))
+
+    def test_lookup(self):
+        ids = IdAllocator()
+        shape = Shape(7)
+        ids.register(shape, 7)
+        self.assertIsNone(ids.lookup(7))
+        ids.track()
+        ids.register(shape, 7)
+        self.assertIs(ids.lookup(7), shape)
+        shape.id = 8
+        self.assertIsNone(ids.lookup(7))
+        self.assertIsNone(ids.lookup(9))
+
+
+class TestBaseIds(unittest.TestCase):
+    """Tests for the ids given by Base"""
+
+    def test_explicit_then_allocated(self):
+        first = Base()
+        Base(first.id + 1)
+        self.assertEqual(Base().id, first.id + 2)
+
+    def test_update_reserves_id(self):
+        r = Rectangle(1, 1)
+        r.update(r.id + 1)
+        self.assertNotEqual(Rectangle(1, 1).id, r.id)
+
+    def test_unhashable_id(self):
+        self.assertEqual(Base([1, 2]).id, [1, 2])
+        self.assertIsNone(Base.get_by_id([1, 2]))
+
+    def test_get_by_id(self):
+        Base.track_ids()
+        try:
+            r = Rectangle(2, 3)
+            self.assertIs(Base.get_by_id(r.id), r)
+        finally:
+            Base.track_ids(False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+"""Unittest for the validator plans of models/base.py
+"""
+import unittest
+from models.base import Base
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestPlan(unittest.TestCase):
+    """Tests for the plans compiled from constraints and aliases"""
+
+    def test_plans(self):
+        self.assertEqual(Rectangle.plan, {
+            'width': (('_Rectangle__width',), 1, 'width'),
+            'height': (('_Rectangle__height',), 1, 'height'),
+            'x': (('_Rectangle__x',), 0, 'x'),
+            'y': (('_Rectangle__y',), 0, 'y')})
+        self.assertEqual(Square.plan['size'],
+                         (('_Rectangle__width', '_Rectangle__height'), 1,
+                          'width'))
+        self.assertEqual(Base.plan, {})
+
+    def test_messages(self):
+        rect = Rectangle(1, 1)
+        for attr, value, error, msg in (
+                ('width', '1', TypeError, 'width must be an integer'),
+                ('width', 0, ValueError, 'width must be > 0'),
+                ('height', 1.0, TypeError, 'height must be an integer'),
+                ('height', -1, ValueError, 'height must be > 0'),
+                ('x', None, TypeError, 'x must be an integer'),
+                ('x', -1, ValueError, 'x must be >= 0'),
+                ('y', True, TypeError, 'y must be an integer'),
+                ('y', -1, ValueError, 'y must be >= 0')):
+            with self.assertRaises(error) as cm:
+                setattr(rect, attr, value)
+            self.assertEqual(str(cm.exception), msg)
+        self.assertEqual(str(rect), '[Rectangle] ({}) 0/0 - 1/1'.format(
+            rect.id))
+
+    def test_constructor(self):
+        with self.assertRaisesRegex(ValueError, 'height must be > 0'):
+            Rectangle(1, 0)
+        with self.assertRaisesRegex(TypeError, 'width must be an integer'):
+            Square('2')
+        rect = Rectangle(2, 3, 0, 4)
+        self.assertEqual((rect.width, rect.height, rect.x, rect.y),
+                         (2, 3, 0, 4))
+
+    def test_square_size(self):
+        square = Square(2)
+        square.size = 5
+        self.assertEqual((square.size, square.width, square.height),
+                         (5, 5, 5))
+        with self.assertRaisesRegex(ValueError, 'width must be > 0'):
+            square.size = 0
+        self.assertEqual(square.size, 5)
+
+    def test_subclass(self):
+        class Box(Rectangle):
+            """rectangle with a depth"""
+            fields = Rectangle.fields + ('depth',)
+            constraints = (('depth', 1),)
+
+            def __init__(self, width, height, depth, id=None):
+                super().__init__(width, height, id=id)
+                self.depth = depth
+
+        box = Box(1, 2, 3)
+        self.assertEqual(box.plan['depth'], (('_Box__depth',), 1, 'depth'))
+        self.assertEqual(set(box.plan) - set(Rectangle.plan), {'depth'})
+        with self.assertRaisesRegex(ValueError, 'depth must be > 0'):
+            box.depth = 0
+        self.assertNotIn('depth', Rectangle.plan)
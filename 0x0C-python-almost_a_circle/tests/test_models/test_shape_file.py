@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+"""Unittest for models/shape_file.py
+"""
+import os
+import tempfile
+import unittest
+from models import shape_file
+from models.rectangle import Rectangle
+from models.shape_file import ShapeFile
+from models.shape_store import ShapeStore
+from models.square import Square
+
+
+class TestShapeFile(unittest.TestCase):
+    """Tests for the binary shape files"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.shapes = [Rectangle(3, 4, 1, 2, 7), Square(5, 1, 1, 8),
+                       Rectangle(2, 6, 0, 0, 2 ** 40)]
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        self.assertEqual(shape_file.save_to_file(self.shapes), 3)
+        loaded = shape_file.load_from_file('Rectangle.bin')
+        self.assertEqual([type(s) for s in loaded],
+                         [Rectangle, Square, Rectangle])
+        self.assertEqual([s.to_dictionary() for s in loaded],
+                         [s.to_dictionary() for s in self.shapes])
+
+    def test_default_filename(self):
+        shape_file.save_to_file([Square(1)])
+        shape_file.save_to_file([])
+        self.assertEqual(sorted(os.listdir()), ['Rectangle.bin',
+                                                'Square.bin'])
+        self.assertEqual(shape_file.load_from_file('Rectangle.bin'), [])
+
+    def test_generator_and_views(self):
+        store = ShapeStore(self.shapes)
+        count = shape_file.save_to_file((view for view in store), 'a.bin')
+        self.assertEqual(count, 3)
+        with ShapeFile('a.bin') as shapes:
+            self.assertEqual(len(shapes), 3)
+            self.assertEqual(shapes.record(1), (1, 8, 5, 5, 1, 1))
+            self.assertEqual(str(shapes[-1]),
+                             '[Rectangle] ({}) 0/0 - 2/6'.format(2 ** 40))
+            with self.assertRaisesRegex(IndexError, 'out of range'):
+                shapes[3]
+
+    def test_failed_save_keeps_file(self):
+        shape_file.save_to_file(self.shapes, 'a.bin')
+
+        def shapes():
+            yield Square(1)
+            raise RuntimeError('stop')
+        with self.assertRaises(RuntimeError):
+            shape_file.save_to_file(shapes(), 'a.bin')
+        self.assertEqual(len(shape_file.load_from_file('a.bin')), 3)
+
+    def test_bad_files(self):
+        with open('empty.bin', 'wb'):
+            pass
+        with open('text.bin', 'w') as f:
+            f.write('[{"id": 1, "size": 2}]')
+        shape_file.save_to_file(self.shapes, 'cut.bin')
+        os.truncate('cut.bin', os.path.getsize('cut.bin') - 1)
+        for name, msg in (('empty.bin', 'not a shape file'),
+                          ('text.bin', 'not a shape file'),
+                          ('cut.bin', 'truncated')):
+            with self.assertRaisesRegex(ValueError, msg):
+                ShapeFile(name)
+
+    def test_json_conversion(self):
+        Square.save_to_file([Square(2, 1, 0, 3), Square(4, id=5)])
+        self.assertEqual(shape_file.json_to_binary(Square), 2)
+        os.remove('Square.json')
+        shape_file.binary_to_json(Square)
+        self.assertEqual([str(s) for s in Square.load_from_file()],
+                         ['[Square] (3) 1/0 - 2', '[Square] (5) 0/0 - 4'])
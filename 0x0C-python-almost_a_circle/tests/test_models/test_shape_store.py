@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+"""Unittest for models/shape_store.py
+"""
+import io
+import unittest
+from models.rectangle import Rectangle
+from models.shape_store import ShapeStore, RectangleView, SquareView
+from models.square import Square
+
+
+class TestShapeStore(unittest.TestCase):
+    """Tests for ShapeStore"""
+
+    def setUp(self):
+        self.shapes = [Rectangle(3, 4, 1, 2, 7), Square(5, 1, 1, 8),
+                       Rectangle(2, 6, 0, 0, 9)]
+        self.store = ShapeStore(self.shapes)
+
+    def test_len_and_views(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertIs(type(self.store[0]), RectangleView)
+        self.assertIs(type(self.store[1]), SquareView)
+        self.assertEqual(self.store[-1].id, 9)
+        with self.assertRaisesRegex(IndexError, 'out of range'):
+            self.store[3]
+
+    def test_round_trip(self):
+        shapes = self.store.to_shapes()
+        self.assertEqual([type(s) for s in shapes],
+                         [Rectangle, Square, Rectangle])
+        self.assertEqual([s.to_dictionary() for s in shapes],
+                         [s.to_dictionary() for s in self.shapes])
+        self.assertEqual(self.store.to_dictionary(),
+                         [s.to_dictionary() for s in self.shapes])
+
+    def test_views_match_shapes(self):
+        for shape, view in zip(self.shapes, self.store):
+            self.assertEqual(str(view), str(shape))
+            self.assertEqual(view.area(), shape.area())
+            expected, out = io.StringIO(), io.StringIO()
+            shape.display(expected)
+            view.display(out)
+            self.assertEqual(out.getvalue(), expected.getvalue())
+
+    def test_update(self):
+        view = self.store[0]
+        view.update(70, 5, 6, 2, 3)
+        self.assertEqual(str(view), '[Rectangle] (70) 2/3 - 5/6')
+        view.update(width=1, y=0)
+        self.assertEqual(view.to_dictionary(),
+                         {'id': 70, 'width': 1, 'height': 6, 'x': 2, 'y': 0})
+        self.assertEqual(self.store.widths[0], 1)
+
+    def test_square_size(self):
+        view = self.store[1]
+        view.size = 9
+        self.assertEqual((view.width, view.height), (9, 9))
+        self.assertEqual(view.to_dictionary(),
+                         {'id': 8, 'size': 9, 'x': 1, 'y': 1})
+        view.update(8, 4)
+        self.assertEqual(str(view), '[Square] (8) 1/1 - 4')
+
+    def test_validation(self):
+        view = self.store[1]
+        for attr, value, error, msg in (
+                ('width', 'a', TypeError, 'width must be an integer'),
+                ('height', 0, ValueError, 'height must be > 0'),
+                ('x', -1, ValueError, 'x must be >= 0'),
+                ('y', 1.5, TypeError, 'y must be an integer'),
+                ('size', 0, ValueError, 'width must be > 0')):
+            with self.assertRaisesRegex(error, msg):
+                setattr(view, attr, value)
+        self.assertEqual(view.to_dictionary(),
+                         {'id': 8, 'size': 5, 'x': 1, 'y': 1})
+
+    def test_no_new_attributes(self):
+        with self.assertRaises(AttributeError):
+            self.store[0].color = 'red'
+
+    def test_area_and_filter(self):
+        self.assertEqual(list(self.store.area()), [12, 25, 12])
+        wide = self.store.filter(lambda id, w, h, x, y: w > h)
+        self.assertEqual([v.id for v in wide], [])
+        big = self.store.filter(lambda id, w, h, x, y: w * h > 12)
+        self.assertEqual([str(v) for v in big], ['[Square] (8) 1/1 - 5'])
+
+    def test_append_view(self):
+        store = ShapeStore()
+        self.assertEqual(store.append(self.store[1]), 0)
+        self.assertIs(type(store[0]), SquareView)
+        store.extend(self.store)
+        self.assertEqual(len(store), 4)
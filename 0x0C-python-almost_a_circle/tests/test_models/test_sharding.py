@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""Unittest for the sharded save and load of models/base.py
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+@mock.patch('models.base.SHARD_MIN_SIZE', 4)
+class TestSharding(unittest.TestCase):
+    """Tests for save_to_file_sharded and load_from_file_sharded"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.rects = [Rectangle(i, i + 1, i % 3, i % 5, 100 + i)
+                      for i in range(1, 11)]
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        Rectangle.save_to_file_sharded(self.rects, shards=3)
+        self.assertEqual(sorted(os.listdir()), ['Rectangle-0.json',
+                                                'Rectangle-1.json',
+                                                'Rectangle-2.json'])
+        for trusted in (False, True):
+            loaded = Rectangle.load_from_file_sharded(trusted)
+            self.assertEqual([r.to_dictionary() for r in loaded],
+                             [r.to_dictionary() for r in self.rects])
+
+    def test_shard_count(self):
+        Rectangle.save_to_file_sharded(self.rects[:5], shards=8)
+        self.assertEqual(sorted(os.listdir()), ['Rectangle-0.json',
+                                                'Rectangle-1.json'])
+        Rectangle.save_to_file_sharded(self.rects[:3], shards=8)
+        self.assertEqual(os.listdir(), ['Rectangle-0.json'])
+        self.assertEqual(len(Rectangle.load_from_file_sharded()), 3)
+
+    def test_empty(self):
+        self.assertEqual(Square.load_from_file_sharded(), [])
+        Square.save_to_file_sharded(None)
+        self.assertEqual(Square.load_from_file_sharded(), [])
+
+    def test_squares(self):
+        squares = [Square(i, id=i) for i in range(1, 10)]
+        Square.save_to_file_sharded(squares, shards=2)
+        with open('Square-1.json') as f:
+            self.assertEqual(json.load(f)[0],
+                             {'id': 6, 'size': 6, 'x': 0, 'y': 0})
+        self.assertEqual([s.size for s in Square.load_from_file_sharded()],
+                         list(range(1, 10)))
+
+    def test_errors_by_row(self):
+        Rectangle.save_to_file_sharded(self.rects, shards=2)
+        with open('Rectangle-1.json') as f:
+            rows = json.load(f)
+        rows[1]['width'] = 0
+        rows[3]['y'] = 'a'
+        with open('Rectangle-1.json', 'w') as f:
+            json.dump(rows, f)
+        with self.assertRaises(ValueError) as cm:
+            Rectangle.load_from_file_sharded()
+        self.assertEqual(str(cm.exception),
+                         'invalid rows:\nrow 6: width must be > 0\n'
+                         'row 8: y must be an integer')
+
+    def test_alias_keys(self):
+        with open('Square-0.json', 'w') as f:
+            json.dump([{'id': 1, 'size': 2, 'width': 3}], f)
+        square, = Square.load_from_file_sharded()
+        self.assertEqual((square.width, square.height), (3, 2))
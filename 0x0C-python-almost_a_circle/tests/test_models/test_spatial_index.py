@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""Unittest for models/spatial_index.py
+"""
+import random
+import unittest
+from models.rectangle import Rectangle
+from models.spatial_index import GridIndex
+from models.square import Square
+
+
+def distance2(shape, px, py):
+    """squared distance from (px, py) to the closest point of shape"""
+    dx = max(shape.x - px, 0, px - (shape.x + shape.width - 1))
+    dy = max(shape.y - py, 0, py - (shape.y + shape.height - 1))
+    return dx * dx + dy * dy
+
+
+class TestGridIndex(unittest.TestCase):
+    """Tests for GridIndex"""
+
+    def setUp(self):
+        self.rng = random.Random(12)
+        self.shapes = [Rectangle(self.rng.randint(1, 30),
+                                 self.rng.randint(1, 30),
+                                 self.rng.randint(0, 300),
+                                 self.rng.randint(0, 300))
+                       for _ in range(200)]
+        self.index = GridIndex(cell_size=16)
+        for shape in self.shapes:
+            self.index.insert(shape)
+
+    def test_cell_size(self):
+        with self.assertRaisesRegex(TypeError, 'must be an integer'):
+            GridIndex('16')
+        with self.assertRaisesRegex(ValueError, 'must be > 0'):
+            GridIndex(0)
+
+    def test_insert_remove(self):
+        shape = self.shapes[0]
+        self.assertEqual(len(self.index), 200)
+        self.assertIn(shape, self.index)
+        with self.assertRaisesRegex(ValueError, 'already indexed'):
+            self.index.insert(shape)
+        self.index.remove(shape)
+        self.assertNotIn(shape, self.index)
+        with self.assertRaisesRegex(ValueError, 'not indexed'):
+            self.index.remove(shape)
+
+    def test_query_point(self):
+        for _ in range(200):
+            px, py = self.rng.randint(-5, 340), self.rng.randint(-5, 340)
+            expected = {id(s) for s in self.shapes
+                        if distance2(s, px, py) == 0}
+            self.assertEqual({id(s) for s in self.index.query_point(px, py)},
+                             expected)
+
+    def test_query_window(self):
+        for _ in range(200):
+            x0, y0 = self.rng.randint(-20, 330), self.rng.randint(-20, 330)
+            x1 = x0 + self.rng.randint(1, 60)
+            y1 = y0 + self.rng.randint(1, 60)
+            expected = {id(s) for s in self.shapes
+                        if s.x < x1 and x0 < s.x + s.width and
+                        s.y < y1 and y0 < s.y + s.height}
+            found = self.index.query_window(x0, y0, x1, y1)
+            self.assertEqual(len(found), len(expected))
+            self.assertEqual({id(s) for s in found}, expected)
+        self.assertEqual(self.index.query_window(0, 0, 0, 400), [])
+        self.assertEqual(self.index.query_window(0, 400, 400, 0), [])
+
+    def test_move(self):
+        square = Square(2, 500, 500)
+        self.index.insert(square)
+        self.assertEqual(self.index.query_point(501, 501), [square])
+        self.index.move(square, x=0, y=0)
+        self.assertEqual(self.index.query_point(501, 501), [])
+        self.assertIn(square, self.index.query_point(1, 1))
+
+    def test_nearest_brute_force(self):
+        for _ in range(200):
+            px = self.rng.randint(-400, 800)
+            py = self.rng.randint(-400, 800)
+            k = self.rng.randint(1, 8)
+            found = self.index.nearest(px, py, k)
+            expected = sorted(distance2(s, px, py) for s in self.shapes)
+            self.assertEqual([distance2(s, px, py) for s in found],
+                             expected[:k])
+
+    def test_nearest_edge_cases(self):
+        self.assertEqual(self.index.nearest(0, 0, 0), [])
+        self.assertEqual(GridIndex().nearest(0, 0), [])
+        self.assertEqual(len(self.index.nearest(0, 0, 500)), 200)
+        index = GridIndex(4)
+        far = Rectangle(1, 1, 1000, 1000)
+        index.insert(far)
+        self.assertEqual(index.nearest(0, 0), [far])